@@ -1,5 +1,8 @@
 from flask import Flask, render_template, request, send_file
 import os
+import time
+from functools import wraps
+import metrics
 from export_excel import main as android_excel_main
 from export_xml import main as android_xml_main
 from export_excel_flutter import main as flutter_excel_main
@@ -7,28 +10,57 @@ from export_arb_flutter import main as flutter_arb_main
 
 app = Flask(__name__)
 
+def track_job(func):
+    """
+    统计导入导出接口的请求数、耗时和正在执行的任务数
+    Args:
+        func: 路由处理函数
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        route = request.path
+        status = 500
+        metrics.inc('multilan_jobs_in_flight', route=route)
+        start = time.perf_counter()
+        try:
+            response = app.make_response(func(*args, **kwargs))
+            status = response.status_code
+            return response
+        finally:
+            metrics.observe('multilan_request_duration_seconds', time.perf_counter() - start, route=route)
+            metrics.inc('multilan_requests_total', route=route, status=str(status))
+            metrics.inc('multilan_jobs_in_flight', -1, route=route)
+    return wrapper
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
+@app.route('/metrics')
+def metrics_endpoint():
+    return metrics.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
 @app.route('/export_excel', methods=['POST'])
+@track_job
 def export_excel():
     project_path = request.form['project_path']
     output_dir = request.form['output_dir']
     flavor = request.form.get('flavor', '').strip() or None
+    since_ref = request.form.get('since_ref', '').strip() or None
     
     if not os.path.exists(project_path):
         return '项目路径不存在', 400
         
     try:
         # 直接调用新的main函数，不需要手动扫描模块
-        android_excel_main(project_path, output_dir, flavor)
+        android_excel_main(project_path, output_dir, flavor, since_ref)
         return f'导出成功！文件保存在: {output_dir}'
     except Exception as e:
         print(f"导出失败: {str(e)}")
         return f'导出失败：{str(e)}', 500
 
 @app.route('/export_xml', methods=['POST'])
+@track_job
 def export_xml():
     project_path = request.form['project_path']
     excel_dir = request.form['excel_dir']
@@ -45,6 +77,7 @@ def export_xml():
         return f'导入失败：{str(e)}', 500
 
 @app.route('/export_excel_flutter', methods=['POST'])
+@track_job
 def export_excel_flutter():
     project_path = request.form['project_path']
     output_path = request.form['output_path']
@@ -61,6 +94,7 @@ def export_excel_flutter():
         return f'导出失败：{str(e)}', 500
 
 @app.route('/export_arb', methods=['POST'])
+@track_job
 def export_arb():
     project_path = request.form['project_path']
     excel_path = request.form['excel_path']
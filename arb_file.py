@@ -0,0 +1,129 @@
+import json
+from typing import Any, Dict, Tuple
+from metrics import record_file_read, record_file_written
+
+# 安装了orjson时使用orjson加速解析和序列化，否则使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOCALE_KEY = '@@locale'
+
+# orjson与json的浮点数指数写法不同（1e-7 / 1e-07），输出中可能含有指数形式的数字时改用json
+# 先把数字统一替换为0再查找"0e"，比逐字符匹配的正则快；字符串中的误判只是退回json
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+
+
+def loads_arb(content: bytes) -> Dict[str, Any]:
+    """
+    解析ARB文件内容，保留key的原有顺序
+    Args:
+        content: ARB文件内容
+    Returns:
+        Dict[str, Any]: ARB内容
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content.decode('utf-8'))
+
+
+def dumps_arb(data: Dict[str, Any]) -> bytes:
+    """
+    序列化ARB内容，使用2个空格缩进，不转义非ASCII字符，不添加末尾换行，两种后端的输出完全一致
+    Args:
+        data: ARB内容
+    Returns:
+        bytes: UTF-8编码的文件内容
+    """
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # 超出64位的整数等orjson不支持的值
+            content = None
+        if content is not None and b'0e' not in content.translate(_DIGITS_TO_ZERO):
+            return content
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def load_arb(file_path: str) -> Dict[str, Any]:
+    """
+    读取ARB文件
+    Args:
+        file_path: ARB文件路径
+    Returns:
+        Dict[str, Any]: ARB内容
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    record_file_read(file_path, len(content))
+    return loads_arb(content)
+
+
+def split_arb(data: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    将ARB内容拆分为可翻译的消息和@开头的元数据
+    Args:
+        data: ARB内容
+    Returns:
+        Tuple[Dict[str, str], Dict[str, Any]]: 消息字典和元数据字典（包括@@locale等全局属性）
+    """
+    messages = {}
+    metadata = {}
+    for key, value in data.items():
+        if key.startswith('@'):
+            metadata[key] = value
+        else:
+            messages[key] = value
+    return messages, metadata
+
+
+def merge_arb(original: Dict[str, Any], updates: Dict[str, str], locale: str) -> Dict[str, Any]:
+    """
+    按原文件的key顺序合并翻译，一次遍历完成，元数据保持在原有位置
+    Args:
+        original: 原始ARB内容
+        updates: 新的翻译内容，@开头的key会被忽略
+        locale: 语言代码
+    Returns:
+        Dict[str, Any]: 合并后的ARB内容，@@locale位于首位，新增的消息追加在末尾
+    """
+    merged = {LOCALE_KEY: locale}
+    for key, value in original.items():
+        if key == LOCALE_KEY:
+            continue
+        if not key.startswith('@') and key in updates:
+            merged[key] = updates[key]
+        else:
+            merged[key] = value
+
+    for key, value in updates.items():
+        if key not in merged and not key.startswith('@'):
+            merged[key] = value
+    return merged
+
+
+def is_same_arb(left: Dict[str, Any], right: Dict[str, Any]) -> bool:
+    """
+    判断两个ARB内容是否完全一致（包括key的顺序）
+    Args:
+        left: ARB内容
+        right: ARB内容
+    Returns:
+        bool: 是否一致
+    """
+    return len(left) == len(right) and list(left.items()) == list(right.items())
+
+
+def write_arb(file_path: str, data: Dict[str, Any]) -> None:
+    """
+    写入ARB文件
+    Args:
+        file_path: ARB文件路径
+        data: ARB内容
+    """
+    content = dumps_arb(data)
+    with open(file_path, 'wb') as f:
+        f.write(content)
+    record_file_written(file_path, len(content))
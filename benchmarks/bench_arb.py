@@ -0,0 +1,103 @@
+"""
+ARB读写性能测试：生成20k条消息、30种语言的应用，对比原先的OrderedDict+json实现和arb_file
+（标准库json与orjson两种后端），并测试内容无变化时跳过写入的效果
+
+用法: python benchmarks/bench_arb.py [消息数量] [语言数量]
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arb_file
+from export_arb_flutter import generate_arb, read_original_arb
+
+
+def generate_app(arb_dir: str, messages: int, locales: int) -> list:
+    lang_codes = [f'l{index:02d}' for index in range(locales)]
+    for lang_code in lang_codes:
+        data = {'@@locale': lang_code}
+        for index in range(messages):
+            key = f'message{index}'
+            data[key] = f'{lang_code} 文本 {index} {{count}}'
+            if lang_code == lang_codes[0]:
+                data[f'@{key}'] = {'description': f'描述 {index}', 'placeholders': {'count': {'type': 'int'}}}
+        with open(os.path.join(arb_dir, f'intl_{lang_code}.arb'), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    return lang_codes
+
+
+def build_updates(messages: int, lang_code: str, changed: bool) -> dict:
+    # 模拟Excel中的翻译：changed时修改十分之一的消息
+    return {
+        f'message{index}': f'{lang_code} 文本 {index} {{count}}' + (' *' if changed and index % 10 == 0 else '')
+        for index in range(messages)
+    }
+
+
+def old_generate(arb_path: str, updates: dict, lang_code: str) -> None:
+    # 原先export_arb_flutter.read_original_arb + generate_arb的实现
+    with open(arb_path, 'r', encoding='utf-8') as file:
+        original_arb = json.load(file, object_pairs_hook=OrderedDict)
+    new_arb = OrderedDict()
+    new_arb['@@locale'] = lang_code
+    for key in original_arb.keys():
+        if key == '@@locale':
+            continue
+        if key in updates and str(updates[key]) != 'nan' and str(updates[key]).strip():
+            new_arb[key] = str(updates[key])
+        elif key in original_arb:
+            new_arb[key] = original_arb[key]
+    for key, value in updates.items():
+        if key not in new_arb and str(value) != 'nan' and str(value).strip():
+            new_arb[key] = str(value)
+    with open(arb_path, 'w', encoding='utf-8') as f:
+        json.dump(new_arb, f, ensure_ascii=False, indent=2)
+
+
+def new_generate(arb_path: str, updates: dict, lang_code: str) -> bool:
+    # export_arb_flutter的当前实现，屏蔽逐个文件的输出
+    with redirect_stdout(io.StringIO()):
+        return generate_arb(updates, read_original_arb(arb_path), arb_path, lang_code)
+
+
+def run_case(name: str, arb_dir: str, lang_codes: list, all_updates: dict, generate) -> None:
+    start = time.perf_counter()
+    written = 0
+    for lang_code in lang_codes:
+        result = generate(os.path.join(arb_dir, f'intl_{lang_code}.arb'), all_updates[lang_code], lang_code)
+        written += 1 if result is None else int(result)
+    print(f"{name:<40} {time.perf_counter() - start:7.2f} s  写入 {written}/{len(lang_codes)} 个文件")
+
+
+def main(messages: int, locales: int) -> None:
+    orjson_module = arb_file.orjson
+    backends = [('json', None)] + ([('orjson', orjson_module)] if orjson_module else [])
+    print(f"{messages} 条消息 x {locales} 种语言" + ('' if orjson_module else '（未安装orjson）'))
+
+    for changed in (True, False):
+        print('十分之一的消息有修改:' if changed else '内容无变化:')
+        cases = [('原实现 OrderedDict + json', None)] + [(f'arb_file ({name})', backend) for name, backend in backends]
+        for name, backend in cases:
+            with tempfile.TemporaryDirectory() as arb_dir:
+                lang_codes = generate_app(arb_dir, messages, locales)
+                all_updates = {code: build_updates(messages, code, changed) for code in lang_codes}
+                if name.startswith('原实现'):
+                    run_case(name, arb_dir, lang_codes, all_updates, old_generate)
+                else:
+                    arb_file.orjson = backend
+                    try:
+                        run_case(name, arb_dir, lang_codes, all_updates, new_generate)
+                    finally:
+                        arb_file.orjson = orjson_module
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 30)
@@ -0,0 +1,58 @@
+"""
+按字节扫描ARB模板的@@locale与完整JSON解析的性能对比（package发现时每个package读取一次模板）
+
+用法: python benchmarks/bench_resource_scan.py [消息数量]
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+import timeit
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flutter_packages import read_arb_locale
+
+
+def json_read_arb_locale(arb_path: str) -> str:
+    # 改动前的实现：完整解析模板文件
+    with open(arb_path, 'r', encoding='utf-8') as file:
+        return json.load(file).get('@@locale', '')
+
+
+def write_arb(path: str, count: int, locale_position: str) -> None:
+    data = {'@@locale': 'en'} if locale_position == 'first' else {}
+    for index in range(count):
+        data[f'message{index}'] = f'Message {index} {{count}} "quoted"'
+        data[f'@message{index}'] = {
+            'description': f'desc {{x}} {index}',
+            'placeholders': {'count': {'type': 'int', 'example': '3'}},
+        }
+    if locale_position == 'last':
+        data['@@locale'] = 'en'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def measure(func) -> float:
+    with redirect_stdout(io.StringIO()):
+        return min(timeit.repeat(func, number=1, repeat=5))
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        arb_path = os.path.join(temp_dir, 'app_en.arb')
+        for locale_position in ('first', 'missing', 'last'):
+            write_arb(arb_path, count, locale_position)
+            assert read_arb_locale(arb_path) == json_read_arb_locale(arb_path)
+            size = os.path.getsize(arb_path) / 1024 / 1024
+            json_seconds = measure(lambda: json_read_arb_locale(arb_path))
+            scan_seconds = measure(lambda: read_arb_locale(arb_path))
+            print(f"@@locale {locale_position:<8} {size:6.1f} MB  json.load {json_seconds:.4f} s  "
+                  f"字节扫描 {scan_seconds:.4f} s")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
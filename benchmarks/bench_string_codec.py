@@ -0,0 +1,57 @@
+"""
+string_codec吞吐量测试，与原先export_xml中链式str.replace的实现对比
+
+用法: python benchmarks/bench_string_codec.py [字符串数量]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from string_codec import encode_string_value, unescape_android_quotes, unescape_xml_text
+
+SAMPLES = [
+    "Don't forget to save your changes",
+    'Tap "OK" to continue & <b>retry</b>',
+    '已下载 %1$d/%2$d 个文件',
+    'Price: 5 &lt; 10 &amp;&amp; 10 &gt; 5 &quot;quoted&quot; &apos;single&apos;',
+    "\\'escaped\\' \\n new line",
+    '<![CDATA[<a href="https://example.com">link</a>]]>',
+]
+
+
+def unescape_html_replace(text: str) -> str:
+    # 原先export_xml.unescape_html的实现
+    replacements = {
+        '&quot;': '"',
+        '&gt;': '>',
+        '&lt;': '<',
+        '&amp;': '&',
+        '&apos;': "'",
+    }
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    return text
+
+
+def run(count: int) -> None:
+    rng = random.Random(0)
+    texts = [rng.choice(SAMPLES) for _ in range(count)]
+    size = sum(len(t) for t in texts)
+
+    cases = [
+        ('unescape: 链式replace', lambda: [unescape_html_replace(t) for t in texts]),
+        ('unescape: unescape_xml_text', lambda: [unescape_xml_text(t) for t in texts]),
+        ('encode_string_value', lambda: [encode_string_value(t) for t in texts]),
+        ('unescape_android_quotes', lambda: [unescape_android_quotes(t) for t in texts]),
+    ]
+    print(f"{count} 个字符串, 共 {size / 1024 / 1024:.2f} MB 字符")
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:<32} {seconds * 1000:8.1f} ms  {size / seconds / 1024 / 1024:8.1f} MB/s")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
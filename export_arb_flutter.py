@@ -1,8 +1,11 @@
 import os
-import json
 import pandas as pd
-from typing import Dict, List
-from collections import OrderedDict
+from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from arb_file import is_same_arb, load_arb, merge_arb, write_arb
+from metrics import record_file_read
+from flutter_packages import (DEFAULT_ARB_DIR, DEFAULT_FILE_PREFIX, DEFAULT_LOCALE,
+                              assign_sheet_names, find_flutter_packages, load_package)
 
 def read_excel(file_path: str) -> pd.DataFrame:
     """
@@ -13,74 +16,79 @@ def read_excel(file_path: str) -> pd.DataFrame:
         DataFrame: 包含翻译内容的数据框
     """
     try:
-        return pd.read_excel(file_path)
+        df = pd.read_excel(file_path)
+        record_file_read(file_path)
+        return df
     except Exception as e:
         raise Exception(f"读取Excel文件失败: {str(e)}")
 
-def read_original_arb(file_path: str) -> OrderedDict:
+def read_workbook(file_path: str) -> Dict[str, pd.DataFrame]:
+    """
+    读取Excel文件中的所有工作表
+    Args:
+        file_path: Excel文件路径
+    Returns:
+        Dict[str, DataFrame]: 工作表名称到数据框的映射
+    """
+    try:
+        workbook = pd.read_excel(file_path, sheet_name=None)
+        record_file_read(file_path)
+        return workbook
+    except Exception as e:
+        raise Exception(f"读取Excel文件失败: {str(e)}")
+
+def read_original_arb(file_path: str) -> Dict[str, Any]:
     """
     读取原始ARB文件，保留顺序
     Args:
         file_path: ARB文件路径
     Returns:
-        OrderedDict: 保持原有顺序的ARB内容
+        Dict[str, Any]: 保持原有顺序的ARB内容
     """
     if os.path.exists(file_path):
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                # 使用object_pairs_hook=OrderedDict来保持顺序
-                return json.load(file, object_pairs_hook=OrderedDict)
+            return load_arb(file_path)
         except Exception as e:
             print(f"警告：无法解析原始ARB文件 {file_path}: {str(e)}")
     
-    return OrderedDict()
+    return {}
 
-def generate_arb(data: Dict[str, str], original_arb: OrderedDict, output_path: str, lang_code: str) -> None:
+def generate_arb(data: Dict[str, str], original_arb: Dict[str, Any], output_path: str, lang_code: str) -> bool:
     """
-    生成ARB文件，保留原有文件的结构和顺序
+    生成ARB文件，保留原有文件的结构、顺序和@元数据，内容没有变化时不写文件
     Args:
         data: 包含key-value对的字典
         original_arb: 原始ARB文件的内容
         output_path: 输出文件路径
         lang_code: 语言代码
+    Returns:
+        bool: 是否写入了文件
     """
-    # 创建新的有序字典
-    new_arb = OrderedDict()
-    
-    # 添加@@locale
-    new_arb['@@locale'] = lang_code
-    
-    # 如果有原始文件，按原始文件的顺序更新内容
-    if original_arb:
-        for key in original_arb.keys():
-            if key == '@@locale':
-                continue
-            if key in data and str(data[key]) != 'nan' and str(data[key]).strip():
-                new_arb[key] = str(data[key])
-            elif key in original_arb:
-                new_arb[key] = original_arb[key]
-    
-    # 添加原始文件中没有的新翻译内容
-    for key, value in data.items():
-        if key not in new_arb and str(value) != 'nan' and str(value).strip():
-            new_arb[key] = str(value)
+    new_arb = merge_arb(original_arb, data, lang_code)
+    if os.path.exists(output_path) and is_same_arb(new_arb, original_arb):
+        print(f"ARB文件无变化，跳过: {output_path}")
+        return False
 
     # 确保输出目录存在
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # 保存文件，使用4个空格缩进，不添加末尾换行
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(new_arb, f, ensure_ascii=False, indent=2)
+    # 保存文件，使用2个空格缩进，不添加末尾换行
+    write_arb(output_path, new_arb)
     print(f"已生成ARB文件: {output_path}")
+    return True
 
-def process_translations(df: pd.DataFrame, project_path: str) -> None:
+def process_translations(df: pd.DataFrame, project_path: str, arb_dir: str = DEFAULT_ARB_DIR,
+                         file_prefix: str = DEFAULT_FILE_PREFIX, default_locale: str = DEFAULT_LOCALE) -> None:
     """
     处理翻译数据并生成ARB文件
     Args:
         df: 包含翻译的DataFrame
-        project_path: Flutter项目根目录路径
+        project_path: Flutter项目（package）根目录路径
+        arb_dir: ARB文件目录，相对于项目根目录
+        file_prefix: ARB文件名前缀
+        default_locale: default列对应的语言代码
     """
-    l10n_path = os.path.join(project_path, 'lib', 'l10n')
+    l10n_path = os.path.join(project_path, arb_dir)
     
     # 确保l10n目录存在
     os.makedirs(l10n_path, exist_ok=True)
@@ -88,23 +96,22 @@ def process_translations(df: pd.DataFrame, project_path: str) -> None:
     # 获取所有列名
     columns = df.columns.tolist()
     
+    keys = df['key'].astype(str)
+    
     # 从第二列开始处理（跳过'key'列）
     for col in columns[1:]:
         # 处理default列的特殊情况
         if col == 'default':
-            lang_code = 'zh_CN'
-            file_name = 'intl_zh_CN.arb'
+            lang_code = default_locale
         else:
             # 直接使用列名作为语言代码和文件名
             lang_code = col
-            file_name = f'intl_{col}.arb'
+        file_name = f'{file_prefix}{lang_code}.arb'
         
         # 创建key-value字典
-        translations = {
-            str(row['key']): str(row[col])
-            for _, row in df.iterrows()
-            if pd.notna(row[col]) and str(row[col]).strip()
-        }
+        values = df[col]
+        mask = values.notna() & (values.astype(str).str.strip() != '')
+        translations = dict(zip(keys[mask], values[mask].astype(str)))
         
         # 读取原始ARB文件
         original_arb_path = os.path.join(l10n_path, file_name)
@@ -115,17 +122,36 @@ def process_translations(df: pd.DataFrame, project_path: str) -> None:
 
 def main(project_path: str, excel_path: str) -> None:
     """
-    主函数
+    主函数，Excel中的每个工作表对应项目中的一个package
     Args:
-        project_path: Flutter目根目录路径
+        project_path: Flutter项目根目录路径（单个项目或monorepo）
         excel_path: Excel文件路径
     """
     try:
         # 读取Excel文件
-        df = read_excel(excel_path)
-        
-        # 处理翻译并生成ARB文件
-        process_translations(df, project_path)
+        workbook = read_workbook(excel_path)
+        sheets = assign_sheet_names(find_flutter_packages(project_path))
+
+        tasks = []
+        for sheet_name, df in workbook.items():
+            package = sheets.get(sheet_name)
+            if package is None and len(workbook) == 1 and len(sheets) <= 1:
+                # 兼容只有一个工作表的旧版Excel
+                package = next(iter(sheets.values()), None) or load_package(project_path)
+            if package is None:
+                print(f"警告：工作表 {sheet_name} 对应的package在项目中不存在，跳过处理")
+                continue
+            tasks.append((df, package))
+
+        # 处理翻译并并发生成各个package的ARB文件
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(process_translations, df, package.path, package.arb_dir,
+                                package.file_prefix, package.default_locale)
+                for df, package in tasks
+            ]
+            for future in futures:
+                future.result()
         
         print("所有ARB文件已生成完毕")
     except Exception as e:
@@ -1,7 +1,10 @@
 import os
-import xml.etree.ElementTree as ET
+import subprocess
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+from gradle_settings import assign_output_names, resolve_modules
+from metrics import record_cache, record_file_read, record_file_written
+from string_codec import parse_resource_xml, unescape_android_quotes
 
 def parse_xml_file(xml_path: str) -> List[Tuple[str, str, bool]]:
     """
@@ -12,13 +15,15 @@ def parse_xml_file(xml_path: str) -> List[Tuple[str, str, bool]]:
         List[Tuple[str, str, bool]]: 包含(key, value, is_translatable)的列表
     """
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        # CDATA片段原样保留在文本中，导入时由string_codec原样写回
+        root = parse_resource_xml(xml_path)
+        record_file_read(xml_path)
         result = []
         
         for string in root.findall('string'):
             key = string.get('name', '')
-            value = string.text or ''
+            # ET已还原XML实体，这里再还原引号转义，导入时由string_codec重新编码
+            value = unescape_android_quotes(string.text or '')
             translatable = string.get('translatable', 'true').lower() != 'false'
             result.append((key, value, translatable))
             
@@ -85,16 +90,17 @@ def find_strings_xml_files(module_path: str, flavor: str = None, include_res_int
     
     return xml_files
 
-def process_module(module_path: str, output_dir: str, flavor: str = None) -> None:
+def process_module(module_path: str, output_dir: str, flavor: str = None, module_name: str = None) -> None:
     """
     处理单个模块的strings.xml文件
     Args:
         module_path: 模块根目录路径
         output_dir: 输出目录路径
         flavor: 可选的flavor名称
+        module_name: 导出文件使用的模块名称，默认为模块目录名
     """
     try:
-        module_name = os.path.basename(module_path)
+        module_name = module_name or os.path.basename(module_path)
         
         # 处理主要的strings.xml文件
         xml_files = find_strings_xml_files(module_path, flavor, include_res_intl=False)
@@ -129,6 +135,7 @@ def process_strings_to_excel(xml_files: Dict[str, str], output_name: str, output
     for key, value, translatable in default_strings:
         data['key'].append(f"#notranslation#{key}" if not translatable else key)
         data['default'].append(value)
+    key_index = {key: index for index, (key, _, _) in enumerate(default_strings)}
 
     # 处理其他语言文件
     for lang_code, xml_path in xml_files.items():
@@ -139,15 +146,10 @@ def process_strings_to_excel(xml_files: Dict[str, str], output_name: str, output
         strings = parse_xml_file(xml_path)
         
         for key, value, _ in strings:
-            try:
-                index = data['key'].index(key)
-            except ValueError:
-                try:
-                    index = data['key'].index(f"#notranslation#{key}")
-                except ValueError:
-                    print(f"警告：在{lang_code}中发现未知的key: {key}")
-                    continue
-            
+            index = key_index.get(key)
+            if index is None:
+                print(f"警告：在{lang_code}中发现未知的key: {key}")
+                continue
             data[lang_code][index] = value
 
     # 创建输出目录
@@ -157,6 +159,7 @@ def process_strings_to_excel(xml_files: Dict[str, str], output_name: str, output
     df = pd.DataFrame(data)
     output_path = os.path.join(output_dir, f"{output_name}.xlsx")
     df.to_excel(output_path, index=False)
+    record_file_written(output_path)
     print(f"已生成Excel文件: {output_path}")
 
 def parse_settings_gradle(project_path: str) -> List[str]:
@@ -167,44 +170,126 @@ def parse_settings_gradle(project_path: str) -> List[str]:
     Returns:
         List[str]: 模块路径列表
     """
-    settings_file = os.path.join(project_path, 'settings.gradle')
-    if not os.path.exists(settings_file):
-        settings_file = os.path.join(project_path, 'settings.gradle.kts')
-        if not os.path.exists(settings_file):
-            raise Exception("未找到settings.gradle或settings.gradle.kts文件")
-
-    modules = []
     try:
-        with open(settings_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # 匹配include语句，支持单引号和双引号的写法
-        import re
-        # 匹配 include ':app', ':module1', ':module2' 这样的写法
-        includes = re.findall(r"include\s+['\"]([^'\"]+)['\"]", content)
-        # 匹配 include(":app", ":module1", ":module2") 这样的写法
-        includes.extend(re.findall(r'include\([\'"]([^\'"]+)[\'"]\)', content))
-        
-        for module in includes:
-            # 将 :app 或 :modules:xxx 转换为实际路径
-            module_path = module.replace(':', os.sep).strip()
-            if module_path.startswith(os.sep):
-                module_path = module_path[1:]
-            modules.append(module_path)
-            
-    except Exception as e:
+        # 模块图按settings文件指纹缓存，支持多参数include、includeBuild和自定义projectDir
+        modules = list(resolve_modules(project_path).values())
+    except (OSError, UnicodeDecodeError) as e:
         print(f"解析settings.gradle文件失败: {str(e)}")
         return []
         
     return modules
 
-def main(project_path: str, output_dir: str = "output", flavor: str = None) -> None:
+def get_changed_files(project_path: str, since_ref: str) -> Optional[Set[str]]:
+    """
+    通过git获取相对于指定ref有改动的文件（包括未提交和未跟踪的文件）
+    Args:
+        project_path: Android项目根目录路径
+        since_ref: 对比的git ref，例如 origin/main 或 HEAD~1
+    Returns:
+        Optional[Set[str]]: 相对于项目根目录的文件路径集合（使用/分隔），git不可用时返回None
+    """
+    # ref来自用户输入，不能让git把它当作选项解析
+    if not since_ref or since_ref.startswith('-'):
+        print(f"警告：无效的git ref {since_ref!r}，将处理所有模块")
+        return None
+
+    changed_files = set()
+    try:
+        # 先解析为commit SHA，后续命令只使用解析后的SHA
+        commit = subprocess.run(
+            ['git', '-C', project_path, 'rev-parse', '--verify', '--quiet', '--end-of-options',
+             f'{since_ref}^{{commit}}'],
+            capture_output=True, text=True, check=True).stdout.strip()
+        commands = [
+            ['git', '-C', project_path, 'diff', '--name-only', '--relative', commit, '--'],
+            ['git', '-C', project_path, 'ls-files', '--others', '--exclude-standard'],
+        ]
+        for command in commands:
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+            changed_files.update(line.strip() for line in output.splitlines() if line.strip())
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"警告：无法通过git获取改动文件，将处理所有模块: {str(e)}")
+        return None
+    return changed_files
+
+def is_string_resource_change(relative_path: str, flavor: str = None) -> bool:
+    """
+    判断模块内的文件改动是否涉及strings.xml所在的values目录
+    Args:
+        relative_path: 相对于模块根目录的文件路径（使用/分隔）
+        flavor: 可选的flavor名称
+    Returns:
+        bool: 是否为多语言资源改动
+    """
+    # 形如 src/<main|flavor>/<res|res_intl>/values*/strings.xml
+    parts = relative_path.split('/')
+    if len(parts) < 4 or parts[0] != 'src':
+        return False
+    if parts[1] not in ('main', flavor):
+        return False
+    return parts[2] in ('res', 'res_intl') and parts[3].startswith('values')
+
+def get_expected_outputs(module_path: str, module_name: str, flavor: str = None) -> List[str]:
+    """
+    获取process_module会为模块生成的Excel文件名，以默认语言的strings.xml是否存在为准
+    Args:
+        module_path: 模块根目录路径
+        module_name: 模块名称
+        flavor: 可选的flavor名称
+    Returns:
+        List[str]: Excel文件名列表
+    """
+    source_sets = ['main', flavor] if flavor else ['main']
+    outputs = []
+    for res_dir, output_name in (('res', module_name), ('res_intl', f"{module_name}-intl")):
+        if any(os.path.exists(os.path.join(module_path, 'src', source_set, res_dir, 'values', 'strings.xml'))
+               for source_set in source_sets):
+            outputs.append(f"{output_name}.xlsx")
+    return outputs
+
+def filter_changed_modules(project_path: str, modules: List[str], changed_files: Set[str], output_dir: str,
+                           flavor: str = None, module_names: Dict[str, str] = None) -> List[str]:
+    """
+    筛选出需要重新导出的模块，未改动且已有导出结果的模块直接复用之前的Excel文件
+    Args:
+        project_path: Android项目根目录路径
+        modules: 模块路径列表
+        changed_files: 有改动的文件路径集合
+        output_dir: 输出目录路径
+        flavor: 可选的flavor名称
+        module_names: 模块路径到导出名称的映射，默认由assign_output_names生成
+    Returns:
+        List[str]: 需要处理的模块路径列表
+    """
+    module_names = module_names or assign_output_names(modules)
+    changed_modules = []
+    for module in modules:
+        prefix = module.replace(os.sep, '/').strip('/') + '/'
+        module_name = module_names[module]
+        # res和res_intl的导出结果都存在时才能复用
+        has_output = all(
+            os.path.exists(os.path.join(output_dir, output))
+            for output in get_expected_outputs(os.path.join(project_path, module), module_name, flavor)
+        )
+        if not has_output or any(
+            path.startswith(prefix) and is_string_resource_change(path[len(prefix):], flavor)
+            for path in changed_files
+        ):
+            record_cache('module_outputs', False)
+            changed_modules.append(module)
+        else:
+            record_cache('module_outputs', True)
+            print(f"模块 {module} 无改动，复用已有的Excel文件")
+    return changed_modules
+
+def main(project_path: str, output_dir: str = "output", flavor: str = None, since_ref: str = None) -> None:
     """
     主函数
     Args:
         project_path: Android项目根目录路径
         output_dir: 输出目录路径
         flavor: 可选的flavor名称
+        since_ref: 可选的git ref，指定后只处理相对于该ref有多语言改动的模块
     """
     try:
         # 自动识别所有模块
@@ -214,13 +299,21 @@ def main(project_path: str, output_dir: str = "output", flavor: str = None) -> N
             return
             
         print(f"找到以下模块: {modules}")
+        module_names = assign_output_names(modules)
+
+        if since_ref:
+            changed_files = get_changed_files(project_path, since_ref)
+            if changed_files is not None:
+                modules = filter_changed_modules(project_path, modules, changed_files, output_dir, flavor,
+                                                 module_names)
+                print(f"相对于 {since_ref} 需要重新导出的模块: {modules}")
         
         for module in modules:
             module_path = os.path.join(project_path, module)
             if not os.path.isdir(module_path):
                 print(f"警告：模块目录不存在: {module_path}")
                 continue
-            process_module(module_path, output_dir, flavor)
+            process_module(module_path, output_dir, flavor, module_names[module])
 
         print(f"所有Excel文件已生成完毕，保存在目录: {output_dir}")
     except Exception as e:
@@ -1,101 +1,134 @@
 import os
-import json
 import pandas as pd
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from arb_file import load_arb, split_arb
+from flutter_packages import (DEFAULT_ARB_DIR, DEFAULT_FILE_PREFIX, DEFAULT_LOCALE,
+                              FlutterPackage, assign_sheet_names, find_flutter_packages)
+from metrics import record_file_written
 
 def parse_arb_file(arb_path: str) -> Dict[str, str]:
     """
-    解析单个ARB文件
+    解析单个ARB文件，只返回可翻译的消息
     Args:
         arb_path: ARB文件路径
     Returns:
         Dict[str, str]: 包含(key, value)的字典
     """
     try:
-        with open(arb_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            # 移除非翻译内容
-            data.pop('@@locale', None)
-            return data
+        # @开头的元数据（包括@@locale和@key描述）不是翻译内容
+        messages, _ = split_arb(load_arb(arb_path))
+        return messages
     except Exception as e:
         print(f"解析ARB文件失败 {arb_path}: {str(e)}")
         return {}
 
-def find_arb_files(project_path: str) -> Dict[str, str]:
+def find_arb_files(project_path: str, arb_dir: str = DEFAULT_ARB_DIR,
+                   file_prefix: str = DEFAULT_FILE_PREFIX) -> Dict[str, str]:
     """
-    在项目中查找所有intl_*.arb文件
+    在项目中查找所有<file_prefix>*.arb文件
     Args:
         project_path: 项目根目录路径
+        arb_dir: ARB文件目录，相对于项目根目录
+        file_prefix: ARB文件名前缀
     Returns:
         Dict[str, str]: 语言代码到文件路径的映射
     """
     arb_files = {}
-    l10n_path = os.path.join(project_path, 'lib', 'l10n')
+    l10n_path = os.path.join(project_path, arb_dir)
     
     if not os.path.exists(l10n_path):
         print(f"多语言目录不存在: {l10n_path}")
         return arb_files
 
     for file_name in os.listdir(l10n_path):
-        if file_name.startswith('intl_') and file_name.endswith('.arb'):
+        if file_name.startswith(file_prefix) and file_name.endswith('.arb'):
             # 从文件名中提取语言代码
             # 例如: intl_zh_CN.arb -> zh_CN, intl_en.arb -> en
-            lang_code = file_name[5:-4]  # 移除 'intl_' 前缀和 '.arb' 后缀
+            lang_code = file_name[len(file_prefix):-4]  # 移除前缀和 '.arb' 后缀
             arb_files[lang_code] = os.path.join(l10n_path, file_name)
     
     return arb_files
 
-def process_arb_files_to_excel(arb_files: Dict[str, str], output_path: str) -> None:
+def arb_files_to_dataframe(arb_files: Dict[str, str], default_locale: str = DEFAULT_LOCALE) -> pd.DataFrame:
     """
-    将ARB文件处理并导出为Excel
+    将ARB文件合并为翻译表格
     Args:
         arb_files: 语言代码到文件路径的映射
-        output_path: 输出文件路径
+        default_locale: 作为default列的语言代码
+    Returns:
+        DataFrame: 包含翻译内容的数据框
     """
-    if 'zh_CN' not in arb_files:  # 修改这里，检查'zh_CN'
-        raise Exception("未找到中文（zh_CN）的ARB文件作为默认语言")
+    if default_locale not in arb_files:
+        raise Exception(f"未找到默认语言（{default_locale}）的ARB文件")
 
-    # 处理中文文件
+    # 处理默认语言文件
     data = {'key': [], 'default': []}
-    default_strings = parse_arb_file(arb_files['zh_CN'])  # 使用'zh_CN'作为key
+    default_strings = parse_arb_file(arb_files[default_locale])
     
     for key, value in default_strings.items():
         data['key'].append(key)
         data['default'].append(value)
+    key_index = {key: index for index, key in enumerate(data['key'])}
 
     # 处理其他语言文件
     for lang_code, arb_path in arb_files.items():
-        if lang_code == 'zh_CN':  # 修改这里，跳过'zh_CN'
+        if lang_code == default_locale:
             continue
 
         data[lang_code] = [''] * len(data['key'])
         strings = parse_arb_file(arb_path)
         
         for key, value in strings.items():
-            try:
-                index = data['key'].index(key)
-                data[lang_code][index] = value
-            except ValueError:
+            index = key_index.get(key)
+            if index is None:
                 print(f"警告：在{lang_code}中发现未知的key: {key}")
+                continue
+            data[lang_code][index] = value
 
-    # 创建输出目录
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # 保存为Excel文件
-    df = pd.DataFrame(data)
-    df.to_excel(output_path, index=False)
-    print(f"已生成Excel文件: {output_path}")
+    return pd.DataFrame(data)
+
+def process_package(package: FlutterPackage) -> Optional[pd.DataFrame]:
+    """
+    读取单个package的ARB文件并生成翻译表格
+    Args:
+        package: package配置
+    Returns:
+        Optional[DataFrame]: 包含翻译内容的数据框，处理失败时返回None
+    """
+    try:
+        arb_files = find_arb_files(package.path, package.arb_dir, package.file_prefix)
+        return arb_files_to_dataframe(arb_files, package.default_locale)
+    except Exception as e:
+        print(f"处理package {package.name} 失败: {str(e)}")
+        return None
 
 def main(project_path: str, output_path: str) -> None:
     """
-    主函数
+    主函数，项目中的每个package导出为Excel中的一个工作表
     Args:
-        project_path: Flutter项目根目录路径
+        project_path: Flutter项目根目录路径（单个项目或monorepo）
         output_path: 输出Excel文件路径
     """
     try:
-        arb_files = find_arb_files(project_path)
-        process_arb_files_to_excel(arb_files, output_path)
+        sheets = assign_sheet_names(find_flutter_packages(project_path))
+        if not sheets:
+            raise Exception(f"未在 {project_path} 中找到包含ARB文件的Flutter package")
+        print(f"找到以下package: {list(sheets.keys())}")
+
+        # 并发解析各个package的ARB文件
+        with ThreadPoolExecutor() as executor:
+            frames = list(executor.map(process_package, sheets.values()))
+        if all(df is None for df in frames):
+            raise Exception("所有package均处理失败")
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with pd.ExcelWriter(output_path) as writer:
+            for sheet_name, df in zip(sheets.keys(), frames):
+                if df is None:
+                    continue
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        record_file_written(output_path)
         print(f"所有Excel文件已生成完毕，保存在: {output_path}")
     except Exception as e:
         print(f"处理失败: {str(e)}")
@@ -4,6 +4,9 @@ import xml.etree.ElementTree as ET
 import xml.dom.minidom as minidom
 from typing import Dict, List, Tuple
 from export_excel import parse_settings_gradle
+from gradle_settings import assign_output_names
+from metrics import record_file_read, record_file_written
+from string_codec import encode_string_value, escape_xml_attr, parse_resource_xml, unescape_xml_text
 
 def read_excel(file_path: str) -> pd.DataFrame:
     """
@@ -14,7 +17,9 @@ def read_excel(file_path: str) -> pd.DataFrame:
         DataFrame: 包含翻译内容的数据框
     """
     try:
-        return pd.read_excel(file_path)
+        df = pd.read_excel(file_path)
+        record_file_read(file_path)
+        return df
     except Exception as e:
         raise Exception(f"读取Excel文件失败: {str(e)}")
 
@@ -26,16 +31,7 @@ def unescape_html(text: str) -> str:
     Returns:
         str: 还原后的文本
     """
-    replacements = {
-        '&quot;': '"',
-        '&gt;': '>',
-        '&lt;': '<',
-        '&amp;': '&',
-        '&apos;': "'",
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+    return unescape_xml_text(text)
 
 def create_string_element(root: ET.Element, key: str, value: str, translatable: bool = True) -> None:
     """
@@ -49,7 +45,7 @@ def create_string_element(root: ET.Element, key: str, value: str, translatable:
     string = ET.SubElement(root, "string")
     string.set("name", key.replace('#notranslation#', '').strip())
     
-    # 直接设置文本，不进行转义
+    # 保存原始文本，写文件时再统一编码
     string.text = str(value)
     
     if not translatable:
@@ -65,8 +61,8 @@ def read_original_xml(file_path: str) -> Tuple[ET.Element, Dict[str, ET.Element]
     """
     if os.path.exists(file_path):
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            root = parse_resource_xml(file_path)
+            record_file_read(file_path)
             # 创建key到element的映射
             string_map = {
                 elem.get('name'): elem
@@ -114,8 +110,9 @@ def generate_xml(data: Dict[str, str], output_path: str) -> None:
         result.append(f'{indent}<resources>\n')
         
         for string in elem:
-            attrs = ' '.join([f'{k}="{v}"' for k, v in string.attrib.items()])
-            result.append(f'{indent}    <string {attrs}>{string.text}</string>\n')
+            attrs = ' '.join([f'{k}="{escape_xml_attr(v)}"' for k, v in string.attrib.items()])
+            text = encode_string_value(string.text or '')
+            result.append(f'{indent}    <string {attrs}>{text}</string>\n')
             
         result.append(f'{indent}</resources>\n')
         return ''.join(result)
@@ -125,6 +122,7 @@ def generate_xml(data: Dict[str, str], output_path: str) -> None:
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write('<?xml version="1.0" encoding="utf-8"?>\n')
         f.write(format_xml(root))
+    record_file_written(output_path)
 
 def process_translations(df: pd.DataFrame, output_dir: str) -> None:
     """
@@ -202,12 +200,11 @@ def main(project_path: str, excel_dir: str):
             
         print(f"找到以下模块: {modules}")
         
-        # 创建模块名到路径的映射
-        module_path_map = {}
-        for module in modules:
-            # 获取最后一级目录名作为模块名
-            module_name = os.path.basename(module)
-            module_path_map[module_name] = module
+        # 创建模块名到路径的映射，模块名与导出Excel时的文件名一致
+        module_path_map = {
+            module_name: module
+            for module, module_name in assign_output_names(modules).items()
+        }
         
         # 遍历Excel目录下的所有xlsx文件
         for excel_file in os.listdir(excel_dir):
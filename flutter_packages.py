@@ -0,0 +1,184 @@
+import os
+import re
+import glob
+import json
+from typing import Dict, List, NamedTuple
+from resource_scan import scan_arb_locale
+
+# 默认沿用intl_utils的目录和命名方式
+DEFAULT_ARB_DIR = os.path.join('lib', 'l10n')
+DEFAULT_FILE_PREFIX = 'intl_'
+DEFAULT_LOCALE = 'zh_CN'
+
+# 查找package时跳过的目录
+SKIP_DIRS = {'build', 'ios', 'android', 'web', 'windows', 'linux', 'macos', 'node_modules'}
+
+# Excel工作表名称的限制
+_SHEET_NAME_MAX_LENGTH = 31
+_INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+
+class FlutterPackage(NamedTuple):
+    """
+    Flutter package的多语言配置，arb_dir为相对于package根目录的路径
+    """
+    name: str
+    path: str
+    arb_dir: str
+    file_prefix: str
+    default_locale: str
+
+
+def read_simple_yaml(file_path: str) -> Dict[str, str]:
+    """
+    读取简单的 key: value 形式的yaml文件（如l10n.yaml），不支持嵌套结构
+    Args:
+        file_path: yaml文件路径
+    Returns:
+        Dict[str, str]: 键值映射
+    """
+    result = {}
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].rstrip()
+            if not line or line[0].isspace() or ':' not in line:
+                continue
+            key, value = line.split(':', 1)
+            result[key.strip()] = value.strip().strip('\'"')
+    return result
+
+def read_melos_packages(project_path: str) -> List[str]:
+    """
+    读取melos.yaml中packages列表的glob规则
+    Args:
+        project_path: 项目根目录路径
+    Returns:
+        List[str]: glob规则列表，没有melos.yaml时返回空列表
+    """
+    melos_file = os.path.join(project_path, 'melos.yaml')
+    if not os.path.exists(melos_file):
+        return []
+
+    patterns = []
+    in_packages = False
+    with open(melos_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].rstrip()
+            if not line:
+                continue
+            if not line[0].isspace():
+                in_packages = line.startswith('packages:')
+            elif in_packages and line.strip().startswith('-'):
+                patterns.append(line.strip()[1:].strip().strip('\'"'))
+    return patterns
+
+def read_package_name(package_path: str) -> str:
+    """
+    从pubspec.yaml中读取package名称
+    Args:
+        package_path: package根目录路径
+    Returns:
+        str: package名称，读取失败时使用目录名
+    """
+    try:
+        return read_simple_yaml(os.path.join(package_path, 'pubspec.yaml')).get('name') \
+            or os.path.basename(os.path.abspath(package_path))
+    except OSError:
+        return os.path.basename(os.path.abspath(package_path))
+
+def read_arb_locale(arb_path: str) -> str:
+    """
+    读取ARB文件中的@@locale
+    Args:
+        arb_path: ARB文件路径
+    Returns:
+        str: 语言代码，不存在时返回空字符串
+    """
+    try:
+        # 模板文件可能有几MB，@@locale通常位于开头，按字节扫描到即可结束
+        locale = scan_arb_locale(arb_path)
+        if locale is not None:
+            return locale
+        with open(arb_path, 'r', encoding='utf-8') as file:
+            return json.load(file).get('@@locale', '')
+    except (OSError, ValueError, AttributeError):
+        return ''
+
+def load_package(package_path: str) -> FlutterPackage:
+    """
+    读取package的多语言配置，优先使用l10n.yaml中的arb-dir和template-arb-file
+    Args:
+        package_path: package根目录路径
+    Returns:
+        FlutterPackage: package配置
+    """
+    name = read_package_name(package_path)
+    l10n_file = os.path.join(package_path, 'l10n.yaml')
+    if not os.path.exists(l10n_file):
+        return FlutterPackage(name, package_path, DEFAULT_ARB_DIR, DEFAULT_FILE_PREFIX, DEFAULT_LOCALE)
+
+    config = read_simple_yaml(l10n_file)
+    arb_dir = os.path.normpath(config.get('arb-dir', DEFAULT_ARB_DIR))
+    template = config.get('template-arb-file', 'app_en.arb')
+    stem = template[:-4] if template.endswith('.arb') else template
+
+    # 模板文件名为 <前缀><语言代码>.arb，优先用@@locale确定语言代码
+    locale = read_arb_locale(os.path.join(package_path, arb_dir, template))
+    if locale and stem.endswith(locale):
+        prefix = stem[:-len(locale)]
+    elif '_' in stem:
+        prefix, locale = stem.split('_', 1)
+        prefix += '_'
+    else:
+        prefix, locale = '', stem
+    return FlutterPackage(name, package_path, arb_dir, prefix, locale)
+
+def find_flutter_packages(project_path: str) -> List[FlutterPackage]:
+    """
+    查找项目中所有包含多语言ARB目录的package，支持单个项目、melos及普通monorepo
+    Args:
+        project_path: 项目根目录路径
+    Returns:
+        List[FlutterPackage]: package配置列表，按路径排序
+    """
+    package_paths = set()
+
+    melos_patterns = read_melos_packages(project_path)
+    if melos_patterns:
+        package_paths.add(project_path)
+        for pattern in melos_patterns:
+            for path in glob.glob(os.path.join(project_path, pattern), recursive=True):
+                if os.path.exists(os.path.join(path, 'pubspec.yaml')):
+                    package_paths.add(path)
+    else:
+        for root, dirs, files in os.walk(project_path):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS]
+            if 'pubspec.yaml' in files:
+                package_paths.add(root)
+
+    packages = []
+    for package_path in sorted(package_paths):
+        package = load_package(package_path)
+        if os.path.isdir(os.path.join(package.path, package.arb_dir)):
+            packages.append(package)
+    return packages
+
+def assign_sheet_names(packages: List[FlutterPackage]) -> Dict[str, FlutterPackage]:
+    """
+    为每个package分配唯一且合法的Excel工作表名称
+    Args:
+        packages: package配置列表
+    Returns:
+        Dict[str, FlutterPackage]: 工作表名称到package的映射
+    """
+    sheets = {}
+    for package in packages:
+        base_name = _INVALID_SHEET_CHARS.sub('_', package.name)[:_SHEET_NAME_MAX_LENGTH] or 'package'
+        sheet_name = base_name
+        index = 2
+        while sheet_name in sheets:
+            suffix = f'_{index}'
+            sheet_name = base_name[:_SHEET_NAME_MAX_LENGTH - len(suffix)] + suffix
+            index += 1
+        sheets[sheet_name] = package
+    return sheets
@@ -0,0 +1,222 @@
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+from metrics import record_cache, record_file_read
+
+SETTINGS_FILE_NAMES = ('settings.gradle', 'settings.gradle.kts')
+
+# 注释（保留字符串字面量，避免把 "http://" 这类内容当成注释）
+_COMMENT_PATTERN = re.compile(r"""('[^'\n]*'|"[^"\n]*")|//[^\n]*|/\*.*?\*/""", re.DOTALL)
+_STRING_PATTERN = re.compile(r"""['"]([^'"\n]+)['"]""")
+# include ':a', ':b' / include(":a", ":b") / 跨行的参数列表
+_INCLUDE_PATTERN = re.compile(
+    r"""\binclude\s*\(?\s*((?:['"][^'"\n]+['"]\s*,?\s*)+)""")
+_INCLUDE_BUILD_PATTERN = re.compile(r"""\bincludeBuild\s*\(?\s*['"]([^'"\n]+)['"]""")
+# project(':x').projectDir = file('path') / new File(settingsDir, 'path') / File(rootDir, "path")
+_PROJECT_DIR_PATTERN = re.compile(
+    r"""\bproject\s*\(\s*['"]([^'"\n]+)['"]\s*\)\s*\.projectDir\s*=\s*([^\n;]+)""")
+# 指向settings文件所在目录的变量：$rootDir/x、"${settingsDir}/x"、rootDir.path + "/x"、"${rootProject.projectDir}/x"
+_ROOT_DIR_REFERENCE = r"""(?:rootDir|settingsDir|rootProject\.projectDir)(?:\.(?:path|absolutePath))?"""
+_ROOT_DIR_REFERENCE_PATTERN = re.compile(r"""\b""" + _ROOT_DIR_REFERENCE + r"""\b""")
+_ROOT_DIR_PREFIX_PATTERN = re.compile(r"""^\$(?:\{\s*""" + _ROOT_DIR_REFERENCE + r"""\s*\}|""" + _ROOT_DIR_REFERENCE
+                                      + r"""\b)""")
+# pluginManagement中includeBuild引入的是构建插件（如build-logic），不是业务模块
+_PLUGIN_MANAGEMENT_PATTERN = re.compile(r"""\bpluginManagement\s*\{""")
+_BRACE_TOKEN_PATTERN = re.compile(r"""'[^'\n]*'|"[^"\n]*"|[{}]""")
+
+# 项目根目录 -> (settings文件指纹, 模块映射)
+_cache: Dict[str, Tuple[List[Tuple[str, int, int]], Dict[str, str]]] = {}
+
+
+def find_settings_file(project_path: str) -> Optional[str]:
+    """
+    查找项目中的settings.gradle或settings.gradle.kts文件
+    Args:
+        project_path: 项目根目录路径
+    Returns:
+        Optional[str]: settings文件路径，不存在时返回None
+    """
+    for file_name in SETTINGS_FILE_NAMES:
+        settings_file = os.path.join(project_path, file_name)
+        if os.path.exists(settings_file):
+            return settings_file
+    return None
+
+
+def _strip_comments(content: str) -> str:
+    return _COMMENT_PATTERN.sub(lambda m: m.group(1) or '', content)
+
+
+def _strip_plugin_management(content: str) -> str:
+    """
+    移除pluginManagement { ... } 代码块，按括号层级匹配，字符串中的括号不计入
+    Args:
+        content: 已去除注释的settings文件内容
+    Returns:
+        str: 移除后的内容
+    """
+    while True:
+        match = _PLUGIN_MANAGEMENT_PATTERN.search(content)
+        if not match:
+            return content
+        depth = 1
+        end = len(content)
+        for token in _BRACE_TOKEN_PATTERN.finditer(content, match.end()):
+            if token.group() == '{':
+                depth += 1
+            elif token.group() == '}':
+                depth -= 1
+                if depth == 0:
+                    end = token.end()
+                    break
+        content = content[:match.start()] + content[end:]
+
+
+def _default_project_dir(project_name: str) -> str:
+    """
+    将 :app 或 :modules:xxx 转换为默认的模块相对路径
+    Args:
+        project_name: gradle项目路径
+    Returns:
+        str: 模块相对路径
+    """
+    return os.path.join(*[part for part in project_name.split(':') if part.strip()])
+
+
+def _parse_settings(settings_file: str, project_path: str, prefix: str, name_prefix: str,
+                    modules: Dict[str, str], fingerprint: List[Tuple[str, int, int]],
+                    visited: set) -> None:
+    """
+    解析单个settings文件，includeBuild引入的构建会递归解析
+    Args:
+        settings_file: settings文件路径
+        project_path: 该settings文件所在的项目根目录
+        prefix: 相对于最外层项目根目录的路径前缀
+        name_prefix: 模块名前缀，includeBuild引入的模块以构建名开头
+        modules: 输出的模块名到模块相对路径的映射
+        fingerprint: 输出的settings文件指纹列表
+        visited: 已解析过的settings文件，避免循环引用
+    """
+    real_path = os.path.realpath(settings_file)
+    if real_path in visited:
+        return
+    visited.add(real_path)
+
+    stat = os.stat(settings_file)
+    fingerprint.append((real_path, stat.st_mtime_ns, stat.st_size))
+
+    with open(settings_file, 'r', encoding='utf-8') as f:
+        content = _strip_plugin_management(_strip_comments(f.read()))
+    record_file_read(settings_file, stat.st_size)
+
+    project_dirs = {}
+    for args in _INCLUDE_PATTERN.findall(content):
+        for project_name in _STRING_PATTERN.findall(args):
+            project_name = project_name.strip()
+            if not project_name.startswith(':'):
+                project_name = f':{project_name}'
+            project_dirs[project_name] = _default_project_dir(project_name)
+
+    # 自定义projectDir，取赋值表达式中最后一个字符串作为路径
+    for project_name, expression in _PROJECT_DIR_PATTERN.findall(content):
+        paths = _STRING_PATTERN.findall(expression)
+        if not paths:
+            print(f"警告：无法解析模块 {project_name} 的projectDir: {expression.strip()}")
+            continue
+        if not project_name.startswith(':'):
+            project_name = f':{project_name}'
+        path = paths[-1]
+        if _ROOT_DIR_REFERENCE_PATTERN.search(expression):
+            # 相对于根目录的写法，去掉变量前缀后按相对路径处理
+            path = _ROOT_DIR_PREFIX_PATTERN.sub('', path).lstrip('/\\')
+        project_dirs[project_name] = os.path.normpath(path or '.')
+
+    for project_name, project_dir in project_dirs.items():
+        modules[f'{name_prefix}{project_name}'] = os.path.normpath(os.path.join(prefix, project_dir))
+
+    for build_dir in _INCLUDE_BUILD_PATTERN.findall(content):
+        build_prefix = os.path.normpath(os.path.join(prefix, build_dir))
+        build_name = f'{name_prefix}:{os.path.basename(build_prefix)}'
+        build_path = os.path.join(project_path, build_dir)
+        build_settings = find_settings_file(build_path)
+        if build_settings:
+            _parse_settings(build_settings, build_path, build_prefix, build_name,
+                            modules, fingerprint, visited)
+        else:
+            # 没有settings文件的构建本身就是一个模块
+            modules[build_name] = build_prefix
+
+
+def _is_fresh(fingerprint: List[Tuple[str, int, int]]) -> bool:
+    """
+    检查缓存的settings文件指纹是否仍然有效
+    Args:
+        fingerprint: settings文件指纹列表
+    Returns:
+        bool: 所有settings文件均未修改时返回True
+    """
+    for path, mtime_ns, size in fingerprint:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+            return False
+    return True
+
+
+def resolve_modules(project_path: str) -> Dict[str, str]:
+    """
+    解析项目的模块图，结果按settings文件指纹缓存
+    Args:
+        project_path: Android项目根目录路径
+    Returns:
+        Dict[str, str]: gradle模块名（如 :app）到模块相对路径的映射，只包含实际存在的目录
+    """
+    settings_file = find_settings_file(project_path)
+    if not settings_file:
+        raise Exception("未找到settings.gradle或settings.gradle.kts文件")
+
+    cache_key = os.path.realpath(project_path)
+    cached = _cache.get(cache_key)
+    if cached and cached[0][0][0] == os.path.realpath(settings_file) and _is_fresh(cached[0]):
+        record_cache('gradle_settings', True)
+        modules = cached[1]
+    else:
+        record_cache('gradle_settings', False)
+        modules = {}
+        fingerprint = []
+        _parse_settings(settings_file, project_path, '', '', modules, fingerprint, set())
+        _cache[cache_key] = (fingerprint, modules)
+
+    existing_modules = {}
+    for project_name, module_path in modules.items():
+        if os.path.isdir(os.path.join(project_path, module_path)):
+            existing_modules[project_name] = module_path
+        else:
+            print(f"警告：模块 {project_name} 的目录不存在: {module_path}")
+    return existing_modules
+
+
+def assign_output_names(module_paths: List[str]) -> Dict[str, str]:
+    """
+    为模块分配导出文件使用的名称，默认使用目录名，目录名重复时改用以_连接的相对路径
+    Args:
+        module_paths: 模块相对路径列表
+    Returns:
+        Dict[str, str]: 模块相对路径到名称的映射
+    """
+    basenames = {}
+    for module_path in module_paths:
+        basenames.setdefault(os.path.basename(module_path), []).append(module_path)
+
+    names = {}
+    for basename, paths in basenames.items():
+        if len(paths) == 1:
+            names[paths[0]] = basename
+            continue
+        print(f"警告：多个模块的目录名均为 {basename}，改用相对路径命名: {paths}")
+        for module_path in paths:
+            parts = [part for part in module_path.replace(os.sep, '/').split('/') if part not in ('', '.', '..')]
+            names[module_path] = '_'.join(parts) or basename
+    return names
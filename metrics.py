@@ -0,0 +1,186 @@
+import os
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# 指标名称 -> (类型, 说明)
+METRICS = {
+    'multilan_requests_total': ('counter', '按路由和状态码统计的请求数'),
+    'multilan_request_duration_seconds': ('histogram', '按路由统计的请求耗时'),
+    'multilan_jobs_in_flight': ('gauge', '正在执行的导入导出任务数'),
+    'multilan_files_read_total': ('counter', '读取的文件数'),
+    'multilan_files_written_total': ('counter', '写入的文件数'),
+    'multilan_bytes_read_total': ('counter', '读取的字节数'),
+    'multilan_bytes_written_total': ('counter', '写入的字节数'),
+    'multilan_cache_requests_total': ('counter', '按缓存名称和结果（hit/miss）统计的缓存查询数'),
+}
+
+# 请求耗时直方图的桶上限（秒）
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float('inf'))
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# 每个线程只写自己的分片，热路径上不需要加锁，导出指标时再合并所有分片
+_local = threading.local()
+_shards: List[Tuple[threading.Thread, Dict[Tuple[str, Labels], float]]] = []
+# 已退出线程的分片合并到这里，避免每个请求线程都留下一个分片
+_retired: Dict[Tuple[str, Labels], float] = {}
+_shards_lock = threading.Lock()
+
+
+def _merge(target: Dict[Tuple[str, Labels], float], source: Dict[Tuple[str, Labels], float]) -> None:
+    # dict()在CPython中是原子操作，不会和写入线程冲突
+    for key, value in dict(source).items():
+        target[key] = target.get(key, 0) + value
+
+
+def _retire_dead_shards() -> None:
+    """
+    合并已退出线程的分片，调用方需持有_shards_lock
+    """
+    alive = []
+    for thread, shard in _shards:
+        if thread.is_alive():
+            alive.append((thread, shard))
+        else:
+            _merge(_retired, shard)
+    _shards[:] = alive
+
+
+def _shard() -> Dict[Tuple[str, Labels], float]:
+    shard = getattr(_local, 'shard', None)
+    if shard is None:
+        shard = _local.shard = {}
+        with _shards_lock:
+            _retire_dead_shards()
+            _shards.append((threading.current_thread(), shard))
+    return shard
+
+
+def _add(name: str, labels: Labels, amount: float) -> None:
+    shard = _shard()
+    key = (name, labels)
+    shard[key] = shard.get(key, 0) + amount
+
+
+def inc(name: str, amount: float = 1, **labels: str) -> None:
+    """
+    增加计数器或仪表盘的值
+    Args:
+        name: 指标名称
+        amount: 增加的数值，仪表盘可以为负数
+        labels: 指标标签
+    """
+    _add(name, tuple(sorted(labels.items())), amount)
+
+
+def observe(name: str, value: float, **labels: str) -> None:
+    """
+    记录一次直方图观测值
+    Args:
+        name: 指标名称
+        value: 观测值
+        labels: 指标标签
+    """
+    label_items = tuple(sorted(labels.items()))
+    bucket = bisect_left(DURATION_BUCKETS, value)
+    _add(f'{name}_bucket', label_items + (('le', bucket),), 1)
+    _add(f'{name}_sum', label_items, value)
+    _add(f'{name}_count', label_items, 1)
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def record_file_read(path: str, size: Optional[int] = None) -> None:
+    """
+    记录一次文件读取
+    Args:
+        path: 文件路径
+        size: 读取的字节数，为None时使用文件大小
+    """
+    inc('multilan_files_read_total')
+    inc('multilan_bytes_read_total', _file_size(path) if size is None else size)
+
+
+def record_file_written(path: str, size: Optional[int] = None) -> None:
+    """
+    记录一次文件写入
+    Args:
+        path: 文件路径
+        size: 写入的字节数，为None时使用文件大小
+    """
+    inc('multilan_files_written_total')
+    inc('multilan_bytes_written_total', _file_size(path) if size is None else size)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    记录一次缓存查询
+    Args:
+        cache: 缓存名称
+        hit: 是否命中
+    """
+    inc('multilan_cache_requests_total', cache=cache, result='hit' if hit else 'miss')
+
+
+def _collect() -> Dict[Tuple[str, Labels], float]:
+    with _shards_lock:
+        _retire_dead_shards()
+        totals = dict(_retired)
+        shards = [shard for _, shard in _shards]
+    for shard in shards:
+        _merge(totals, shard)
+    return totals
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape_label_value(v)}"' for k, v in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render() -> str:
+    """
+    按Prometheus文本格式导出所有指标
+    Returns:
+        str: 指标文本
+    """
+    totals = _collect()
+    lines = []
+    for name, (metric_type, description) in METRICS.items():
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        if metric_type != 'histogram':
+            series = sorted((labels, value) for (metric, labels), value in totals.items() if metric == name)
+            for labels, value in series:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+            continue
+
+        # 直方图按桶累加
+        series = sorted({labels for metric, labels in totals if metric == f'{name}_count'})
+        for labels in series:
+            cumulative = 0
+            for index, bound in enumerate(DURATION_BUCKETS):
+                cumulative += totals.get((f'{name}_bucket', labels + (('le', index),)), 0)
+                bucket_labels = labels + (('le', _format_value(bound)),)
+                lines.append(f'{name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(totals[(f"{name}_sum", labels)])}')
+            lines.append(f'{name}_count{_format_labels(labels)} {_format_value(totals[(f"{name}_count", labels)])}')
+    return '\n'.join(lines) + '\n'
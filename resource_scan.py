@@ -0,0 +1,95 @@
+import json
+import mmap
+import re
+from typing import Iterator, Optional, Tuple
+from metrics import record_file_read
+
+# 按字节匹配ARB（JSON）顶层的 "key": value 项，直接作用于内存映射，不复制文件内容
+_WS = rb'[ \t\r\n]*'
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_SCALAR = rb'[^\s,{}\[\]"]+'
+# 嵌套的对象或数组（@key元数据）只跳过不解析，展开为固定层数，超出层数时由调用方回退到完整解析
+_CONTAINER_DEPTH = 8
+_CONTAINER = rb'[{\[][^{}\[\]"]*(?:' + _STRING + rb'[^{}\[\]"]*)*[}\]]'
+for _ in range(_CONTAINER_DEPTH - 1):
+    _CONTAINER = rb'[{\[][^{}\[\]"]*(?:(?:' + _STRING + rb'|' + _CONTAINER + rb')[^{}\[\]"]*)*[}\]]'
+
+_ARB_START_PATTERN = re.compile(rb'(?:\xef\xbb\xbf)?' + _WS + rb'\{')
+_ARB_ENTRY_PATTERN = re.compile(
+    _WS + rb'(' + _STRING + rb')' + _WS + rb':' + _WS
+    + rb'(' + _STRING + rb'|' + _CONTAINER + rb'|' + _SCALAR + rb')' + _WS + rb'(?:,|(?=\}))')
+_ARB_END_PATTERN = re.compile(_WS + rb'\}')
+
+_LOCALE_KEY = b'"@@locale"'
+
+
+def _iter_arb_entries(content) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    依次返回ARB顶层的key和value原始字节，可以在读到需要的key后提前结束
+    Args:
+        content: 文件内容（bytes或mmap）
+    Returns:
+        Iterator[Tuple[bytes, bytes]]: 带引号的key和value的JSON文本
+    Raises:
+        ValueError: 内容不是可识别的JSON对象
+    """
+    start = _ARB_START_PATTERN.match(content)
+    if not start:
+        raise ValueError('ARB文件不是JSON对象')
+    pos = start.end()
+    while True:
+        match = _ARB_ENTRY_PATTERN.match(content, pos)
+        if not match:
+            break
+        yield match.group(1), match.group(2)
+        pos = match.end()
+    if not _ARB_END_PATTERN.match(content, pos):
+        raise ValueError(f'无法识别的ARB内容，位置 {pos}')
+
+
+def _scan_file(file_path: str, scanner):
+    """
+    使用内存映射读取文件并执行扫描
+    Args:
+        file_path: 文件路径
+        scanner: 接收mmap对象的扫描函数
+    Returns:
+        扫描函数的返回值
+    """
+    with open(file_path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            # 空文件无法映射
+            return scanner(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            record_file_read(file_path, size)
+            return scanner(mapped)
+
+
+def _arb_locale(content) -> Optional[str]:
+    # 文件中没有@@locale时用find在C层面确认即可，不需要逐项扫描
+    offset = content.find(b'@@locale')
+    if offset == -1:
+        return ''
+    # 逐项扫描比C实现的JSON解析慢，@@locale位于文件后半部分时不如直接完整解析
+    if offset > len(content) // 2:
+        return None
+    for key, value in _iter_arb_entries(content):
+        if key == _LOCALE_KEY:
+            locale = json.loads(value)
+            return locale if isinstance(locale, str) else ''
+    return ''
+
+
+def scan_arb_locale(arb_path: str) -> Optional[str]:
+    """
+    按字节扫描ARB文件的@@locale，读到后立即结束，不解析其余内容
+    Args:
+        arb_path: ARB文件路径
+    Returns:
+        Optional[str]: 语言代码，不存在时返回空字符串，无法识别时返回None，调用方应回退到完整解析
+    """
+    try:
+        return _scan_file(arb_path, _arb_locale)
+    except ValueError:
+        return None
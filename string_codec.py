@@ -0,0 +1,217 @@
+import re
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict
+
+# XML文本中必须转义的字符
+_XML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+}
+
+# 属性值使用str.translate一次完成转义
+_XML_ATTR_TABLE = str.maketrans({**_XML_ESCAPES, '"': '&quot;'})
+
+_NAMED_ENTITIES = {
+    'amp': '&',
+    'lt': '<',
+    'gt': '>',
+    'quot': '"',
+    'apos': "'",
+}
+
+# CDATA片段原样保留，反斜杠转义序列作为整体匹配，避免 \\' 这类写法被拆开
+_CDATA = r"<!\[CDATA\[.*?\]\]>"
+_ENTITY = r"&(#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z]+);"
+
+_ENCODE_PATTERN = re.compile(_CDATA + r"|\\.|['\"&<>]", re.DOTALL)
+_XML_UNESCAPE_PATTERN = re.compile(_CDATA + r"|" + _ENTITY, re.DOTALL)
+_QUOTE_UNESCAPE_PATTERN = re.compile(_CDATA + r"|\\.", re.DOTALL)
+# 解析XML前用占位符替换CDATA片段，解析后再还原，使CDATA能原样导出和写回
+_CDATA_BYTES_PATTERN = re.compile(rb"<!\[CDATA\[.*?\]\]>", re.DOTALL)
+_CDATA_PLACEHOLDER_PATTERN = re.compile("\ue000([0-9]+)\ue001")
+
+
+def _decode_entity(name: str, token: str) -> str:
+    """
+    还原单个XML实体，无法识别的实体原样返回
+    Args:
+        name: 实体名称（不含&和;）
+        token: 完整的实体文本
+    Returns:
+        str: 还原后的字符
+    """
+    if name[0] == '#':
+        try:
+            if name[1] in 'xX':
+                return chr(int(name[2:], 16))
+            return chr(int(name[1:]))
+        except (ValueError, OverflowError):
+            return token
+    return _NAMED_ENTITIES.get(name, token)
+
+
+def _make_encoder(quote_map: Dict[str, str]) -> Callable[[re.Match], str]:
+    """
+    创建编码时使用的替换函数
+    Args:
+        quote_map: 单双引号的替换规则
+    Returns:
+        Callable: 供re.sub使用的替换函数
+    """
+    table = {**_XML_ESCAPES, **quote_map}
+
+    def replace(match: re.Match) -> str:
+        token = match.group()
+        if len(token) == 1:
+            return table[token]
+        if token[0] == '\\':
+            # 已有的转义序列保持不变，只处理其中的XML特殊字符
+            return '\\' + _XML_ESCAPES.get(token[1], token[1])
+        return token
+
+    return replace
+
+
+# 普通字符串中单双引号都需要反斜杠转义；整体被双引号包裹时单引号无需转义
+_encode_plain = _make_encoder({"'": "\\'", '"': '\\"'})
+_encode_quoted = _make_encoder({"'": "'", '"': '\\"'})
+
+
+def _replace_all(text: str, replacements) -> str:
+    # 没有反斜杠、CDATA和数字实体时逐个调用str.replace，比正则替换函数快
+    for old, new in replacements:
+        if old in text:
+            text = text.replace(old, new)
+    return text
+
+
+# &必须最先转义、最后还原
+_PLAIN_ENCODE_REPLACEMENTS = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ("'", "\\'"), ('"', '\\"'))
+_QUOTED_ENCODE_REPLACEMENTS = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '\\"'))
+_UNESCAPE_REPLACEMENTS = (('&quot;', '"'), ('&apos;', "'"), ('&lt;', '<'), ('&gt;', '>'), ('&amp;', '&'))
+
+
+def _is_quoted(text: str) -> bool:
+    """
+    判断字符串是否整体被双引号包裹（Android资源中的引用字符串写法）
+    Args:
+        text: 字符串内容
+    Returns:
+        bool: 是否为引用字符串
+    """
+    return len(text) >= 2 and text[0] == '"' and text[-1] == '"' and text[-2] != '\\'
+
+
+def escape_xml_attr(text: str) -> str:
+    """
+    转义XML属性值中的特殊字符
+    Args:
+        text: 原始属性值
+    Returns:
+        str: 转义后的属性值
+    """
+    return text.translate(_XML_ATTR_TABLE)
+
+
+def unescape_xml_text(text: str) -> str:
+    """
+    还原XML实体（包括数字实体），CDATA片段保持不变
+    Args:
+        text: 包含实体的文本
+    Returns:
+        str: 还原后的文本
+    """
+    if '&' not in text:
+        return text
+    if '&#' not in text and '<![CDATA[' not in text:
+        return _replace_all(text, _UNESCAPE_REPLACEMENTS)
+    return _XML_UNESCAPE_PATTERN.sub(
+        lambda m: _decode_entity(m.group(1), m.group()) if m.group(1) else m.group(),
+        text)
+
+
+def _is_escaped_quote_wrapped(text: str) -> bool:
+    """
+    判断字符串是否以转义的双引号开头和结尾（如 \\"OK\\"）
+    Args:
+        text: 字符串内容
+    Returns:
+        bool: 首尾是否均为 \\"
+    """
+    if len(text) < 4 or not text.startswith('\\"') or text[-1] != '"':
+        return False
+    # 末尾引号前连续的反斜杠为奇数个时引号才是被转义的
+    backslashes = len(text) - 1 - len(text[:-1].rstrip('\\'))
+    return backslashes % 2 == 1
+
+
+def unescape_android_quotes(text: str) -> str:
+    """
+    还原 \\' 和 \\" 转义，其他转义序列（如 \\n、\\@）和CDATA片段保持不变
+    首尾的 \\" 保持转义，否则还原后与整体被双引号包裹的引用字符串无法区分，写回时会丢失引号
+    Args:
+        text: 字符串内容
+    Returns:
+        str: 还原后的字符串
+    """
+    if '\\' not in text:
+        return text
+    if _is_escaped_quote_wrapped(text):
+        return '\\"' + unescape_android_quotes(text[2:-2]) + '\\"'
+    return _QUOTE_UNESCAPE_PATTERN.sub(
+        lambda m: m.group()[1] if m.group()[0] == '\\' and m.group()[1] in '\'"' else m.group(), text)
+
+
+def encode_string_value(text: str) -> str:
+    """
+    将文本编码为strings.xml中<string>标签的内容
+    包含反斜杠转义或CDATA时用一次正则扫描同时完成引号转义和XML转义，CDATA片段原样保留
+    Args:
+        text: 翻译文本
+    Returns:
+        str: 可直接写入XML的字符串内容
+    """
+    quoted = _is_quoted(text)
+    if quoted:
+        text = text[1:-1]
+    if '\\' not in text and '<![CDATA[' not in text:
+        if quoted:
+            return '"' + _replace_all(text, _QUOTED_ENCODE_REPLACEMENTS) + '"'
+        return _replace_all(text, _PLAIN_ENCODE_REPLACEMENTS)
+    if quoted:
+        return '"' + _ENCODE_PATTERN.sub(_encode_quoted, text) + '"'
+    return _ENCODE_PATTERN.sub(_encode_plain, text)
+
+
+def _restore_cdata(text: str, sections: list) -> str:
+    if not text or '\ue000' not in text:
+        return text
+    return _CDATA_PLACEHOLDER_PATTERN.sub(lambda m: sections[int(m.group(1))], text)
+
+
+def parse_resource_xml(file_path: str) -> ET.Element:
+    """
+    解析资源XML文件，CDATA片段以原始的<![CDATA[...]]>形式保留在元素文本中，
+    解析结果的文本可以直接交给encode_string_value写回
+    Args:
+        file_path: XML文件路径
+    Returns:
+        ET.Element: XML根元素
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    if b'<![CDATA[' not in content:
+        return ET.fromstring(content)
+
+    sections = []
+
+    def replace(match: re.Match) -> bytes:
+        sections.append(match.group().decode('utf-8'))
+        return f'\ue000{len(sections) - 1}\ue001'.encode('utf-8')
+
+    root = ET.fromstring(_CDATA_BYTES_PATTERN.sub(replace, content))
+    for elem in root.iter():
+        elem.text = _restore_cdata(elem.text, sections)
+        elem.tail = _restore_cdata(elem.tail, sections)
+    return root
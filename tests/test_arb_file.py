@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+import arb_file
+from arb_file import dumps_arb, is_same_arb, load_arb, loads_arb, merge_arb
+from export_arb_flutter import generate_arb
+
+ORIGINAL = {
+    '@@locale': 'en',
+    'hello': 'Hello',
+    '@hello': {'description': 'greeting'},
+    '@@x-generated': True,
+    'bye': 'Bye',
+    '@bye': {'placeholders': {'name': {}}},
+}
+
+# 覆盖两种后端可能写法不同的值：非ASCII、转义字符、空容器、各种数字
+SAMPLES = [
+    ORIGINAL,
+    {},
+    {'@@locale': 'zh_CN', 'k': '中文 😀 "q" \\ \n\t\x01\x7f </b> ', 'empty': '', '@k': {'a': [], 'o': {}}},
+    {'@k': {'placeholders': {'n': {'example': 3, 'min': -1, 'ratio': 1.5, 'tiny': 1e-7, 'huge': 1e20}}}},
+    {'@k': {'big': 2 ** 70, 'flags': [True, False, None]}},
+    {'k': 'colour #1e90ff, 2e2'},
+]
+
+
+def test_merge_arb_keeps_metadata_position():
+    merged = merge_arb(ORIGINAL, {'bye': 'Bye!', 'hello': 'Hi', '@hello': 'ignored'}, 'en')
+    assert list(merged.items()) == [
+        ('@@locale', 'en'),
+        ('hello', 'Hi'),
+        ('@hello', {'description': 'greeting'}),
+        ('@@x-generated', True),
+        ('bye', 'Bye!'),
+        ('@bye', {'placeholders': {'name': {}}}),
+    ]
+
+
+def test_merge_arb_appends_new_keys():
+    merged = merge_arb(ORIGINAL, {'new': 'New', 'hello': 'Hi', '@new': {'description': 'ignored'}}, 'en')
+    assert list(merged) == ['@@locale', 'hello', '@hello', '@@x-generated', 'bye', '@bye', 'new']
+    assert merged['new'] == 'New'
+
+
+def test_merge_arb_forces_locale_first():
+    merged = merge_arb({'hello': 'Bonjour', '@@locale': 'en'}, {}, 'fr')
+    assert list(merged.items()) == [('@@locale', 'fr'), ('hello', 'Bonjour')]
+    assert list(merge_arb({}, {'k': 'v'}, 'de').items()) == [('@@locale', 'de'), ('k', 'v')]
+
+
+def test_is_same_arb_is_order_sensitive():
+    assert is_same_arb(merge_arb(ORIGINAL, {'hello': 'Hello'}, 'en'), ORIGINAL)
+    assert not is_same_arb({'a': '1', 'b': '2'}, {'b': '2', 'a': '1'})
+    assert not is_same_arb({'a': '1'}, {'a': '2'})
+
+
+def test_generate_arb_skips_unchanged_file(tmp_path):
+    arb_path = tmp_path / 'intl_en.arb'
+    # 与dumps_arb不同的格式，文件被重写时内容会变化
+    content = json.dumps(ORIGINAL)
+    arb_path.write_text(content, encoding='utf-8')
+
+    assert not generate_arb({'hello': 'Hello', 'bye': 'Bye'}, load_arb(str(arb_path)), str(arb_path), 'en')
+    assert arb_path.read_text(encoding='utf-8') == content
+
+    assert generate_arb({'hello': 'Hi'}, load_arb(str(arb_path)), str(arb_path), 'en')
+    assert arb_path.read_bytes() == dumps_arb(merge_arb(ORIGINAL, {'hello': 'Hi'}, 'en'))
+
+
+def test_generate_arb_writes_missing_file(tmp_path):
+    arb_path = tmp_path / 'l10n' / 'intl_fr.arb'
+    assert generate_arb({'hello': 'Bonjour'}, {}, str(arb_path), 'fr')
+    assert loads_arb(arb_path.read_bytes()) == {'@@locale': 'fr', 'hello': 'Bonjour'}
+
+
+@pytest.mark.parametrize('data', SAMPLES)
+def test_dumps_arb_matches_json_format(monkeypatch, data):
+    # 文件格式以标准库json的输出为准
+    expected = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    assert dumps_arb(data) == expected
+    monkeypatch.setattr(arb_file, 'orjson', None)
+    assert dumps_arb(data) == expected
+
+
+@pytest.mark.parametrize('data', SAMPLES)
+def test_loads_arb_backends_agree(monkeypatch, data):
+    content = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    loaded = loads_arb(content)
+    monkeypatch.setattr(arb_file, 'orjson', None)
+    assert list(loads_arb(content).items()) == list(loaded.items()) == list(data.items())
@@ -0,0 +1,48 @@
+import subprocess
+
+from export_excel import filter_changed_modules, get_changed_files
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-C', str(repo), *args], check=True, capture_output=True)
+
+
+def write(path, content='<resources/>'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def make_project(tmp_path):
+    write(tmp_path / 'app' / 'src' / 'main' / 'res' / 'values' / 'strings.xml')
+    write(tmp_path / 'lib' / 'src' / 'main' / 'res' / 'values' / 'strings.xml')
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, '-c', 'user.email=a@b', '-c', 'user.name=a', 'commit', '-qm', 'init')
+    return tmp_path
+
+
+def test_get_changed_files(tmp_path):
+    project = make_project(tmp_path)
+    write(project / 'lib' / 'src' / 'main' / 'res' / 'values' / 'strings.xml', '<resources></resources>')
+    assert get_changed_files(str(project), 'HEAD') == {'lib/src/main/res/values/strings.xml'}
+
+
+def test_get_changed_files_rejects_options(tmp_path):
+    project = make_project(tmp_path)
+    target = tmp_path / 'pwned'
+    assert get_changed_files(str(project), f'--output={target}') is None
+    assert get_changed_files(str(project), f'HEAD --output={target}') is None
+    assert not target.exists()
+
+
+def test_filter_changed_modules_requires_intl_output(tmp_path):
+    project = make_project(tmp_path)
+    write(project / 'app' / 'src' / 'main' / 'res_intl' / 'values' / 'strings.xml')
+    output_dir = tmp_path / 'output'
+    for name in ('app.xlsx', 'lib.xlsx'):
+        write(output_dir / name, '')
+
+    assert filter_changed_modules(str(project), ['app', 'lib'], set(), str(output_dir)) == ['app']
+
+    write(output_dir / 'app-intl.xlsx', '')
+    assert filter_changed_modules(str(project), ['app', 'lib'], set(), str(output_dir)) == []
@@ -0,0 +1,126 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import export_arb_flutter
+from flutter_packages import (DEFAULT_ARB_DIR, FlutterPackage, assign_sheet_names, find_flutter_packages,
+                              load_package, read_melos_packages)
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def make_package(path, name, l10n_yaml=None, arb_files=None):
+    write(path / 'pubspec.yaml', f'name: {name}\nversion: 1.0.0\n')
+    if l10n_yaml is not None:
+        write(path / 'l10n.yaml', l10n_yaml)
+    for relative_path, data in (arb_files or {}).items():
+        write(path / relative_path, json.dumps(data, ensure_ascii=False))
+    return path
+
+
+@pytest.mark.parametrize('template, data, prefix, locale', [
+    # 前缀和语言代码都含有_时以@@locale为准
+    ('my_app_zh_CN.arb', {'@@locale': 'zh_CN', 'k': 'v'}, 'my_app_', 'zh_CN'),
+    ('app_en.arb', {'@@locale': 'en'}, 'app_', 'en'),
+    # 没有@@locale时按第一个_拆分
+    ('app_en.arb', {'k': 'v'}, 'app_', 'en'),
+    ('intl_zh_CN.arb', {}, 'intl_', 'zh_CN'),
+    # 模板文件名没有前缀
+    ('en.arb', {'@@locale': 'en'}, '', 'en'),
+    ('en.arb', {}, '', 'en'),
+])
+def test_load_package_template_prefix(tmp_path, template, data, prefix, locale):
+    make_package(tmp_path, 'demo', f'arb-dir: lib/l10n\ntemplate-arb-file: {template}  # 模板\n',
+                 {f'lib/l10n/{template}': data})
+
+    assert load_package(str(tmp_path)) == FlutterPackage(
+        'demo', str(tmp_path), os.path.join('lib', 'l10n'), prefix, locale)
+
+
+def test_load_package_without_l10n_yaml(tmp_path):
+    package = load_package(str(make_package(tmp_path, 'demo')))
+    assert package == FlutterPackage('demo', str(tmp_path), DEFAULT_ARB_DIR, 'intl_', 'zh_CN')
+
+
+def test_read_melos_packages(tmp_path):
+    write(tmp_path / 'melos.yaml', '''name: workspace
+packages:
+  # 业务package
+  - packages/**
+  - "apps/*"   # 应用
+  - 'tools/cli'
+
+scripts:
+  analyze:
+    - not/a/package
+''')
+    assert read_melos_packages(str(tmp_path)) == ['packages/**', 'apps/*', 'tools/cli']
+    assert read_melos_packages(str(tmp_path / 'missing')) == []
+
+
+def test_find_flutter_packages_with_melos(tmp_path):
+    write(tmp_path / 'melos.yaml', 'packages:\n  - packages/**\n')
+    make_package(tmp_path, 'root')
+    make_package(tmp_path / 'packages' / 'feature' / 'login', 'login', arb_files={'lib/l10n/intl_zh_CN.arb': {}})
+    make_package(tmp_path / 'packages' / 'core', 'core')
+    make_package(tmp_path / 'examples' / 'demo', 'demo', arb_files={'lib/l10n/intl_zh_CN.arb': {}})
+
+    # 没有ARB目录的package和melos未包含的目录都会被跳过
+    assert [package.name for package in find_flutter_packages(str(tmp_path))] == ['login']
+
+
+def package_named(name):
+    return FlutterPackage(name, name, DEFAULT_ARB_DIR, 'intl_', 'zh_CN')
+
+
+def test_assign_sheet_names():
+    long_name = 'a_very_long_package_name_for_sheet_tests'
+    packages = [package_named(name) for name in (long_name, long_name, long_name, 'a:b/c', 'a_b_c', '')]
+
+    sheets = assign_sheet_names(packages)
+
+    assert list(sheets) == [
+        long_name[:31],
+        long_name[:29] + '_2',
+        long_name[:29] + '_3',
+        'a_b_c',
+        'a_b_c_2',
+        'package',
+    ]
+    assert list(sheets.values()) == packages
+    assert all(len(name) <= 31 for name in sheets)
+
+
+def test_import_legacy_single_sheet_workbook(tmp_path):
+    project = make_package(tmp_path / 'project', 'demo',
+                           arb_files={'lib/l10n/intl_zh_CN.arb': {'@@locale': 'zh_CN', 'hello': '你好'}})
+    excel_path = tmp_path / 'flutter.xlsx'
+    # 旧版Excel只有一个默认名称的工作表
+    pd.DataFrame({'key': ['hello'], 'default': ['您好'], 'en': ['Hello']}).to_excel(
+        excel_path, sheet_name='Sheet1', index=False)
+
+    export_arb_flutter.main(str(project), str(excel_path))
+
+    l10n_path = project / 'lib' / 'l10n'
+    assert json.loads((l10n_path / 'intl_zh_CN.arb').read_text(encoding='utf-8')) == \
+        {'@@locale': 'zh_CN', 'hello': '您好'}
+    assert json.loads((l10n_path / 'intl_en.arb').read_text(encoding='utf-8')) == \
+        {'@@locale': 'en', 'hello': 'Hello'}
+
+
+def test_import_unknown_sheet_skipped_in_monorepo(tmp_path):
+    for name in ('a', 'b'):
+        make_package(tmp_path / 'project' / name, name, arb_files={'lib/l10n/intl_zh_CN.arb': {'k': name}})
+    excel_path = tmp_path / 'flutter.xlsx'
+    pd.DataFrame({'key': ['k'], 'default': ['x']}).to_excel(excel_path, sheet_name='Sheet1', index=False)
+
+    export_arb_flutter.main(str(tmp_path / 'project'), str(excel_path))
+
+    for name in ('a', 'b'):
+        arb_path = tmp_path / 'project' / name / 'lib' / 'l10n' / 'intl_zh_CN.arb'
+        assert json.loads(arb_path.read_text(encoding='utf-8')) == {'k': name}
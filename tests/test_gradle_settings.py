@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from gradle_settings import assign_output_names, resolve_modules
+
+
+def make_dirs(root, *paths):
+    for path in paths:
+        (root / path).mkdir(parents=True, exist_ok=True)
+
+
+def test_resolve_modules(tmp_path):
+    make_dirs(tmp_path, 'app', 'lib/a', 'libs/remapped', 'other/b', 'build2/core', 'build-logic')
+    (tmp_path / 'settings.gradle').write_text('''
+pluginManagement {
+    includeBuild("build-logic")
+    repositories { gradlePluginPortal() }
+}
+// include ':commented'
+include ':app', ':lib:a'
+include(
+    ":x",
+    ":missing"
+)
+project(':x').projectDir = new File(settingsDir, 'libs/remapped')
+project(":y").projectDir = file("other/b") /* comment */
+include ':y'
+includeBuild('build2')
+''', encoding='utf-8')
+    (tmp_path / 'build2' / 'settings.gradle.kts').write_text('include(":core")', encoding='utf-8')
+
+    assert resolve_modules(str(tmp_path)) == {
+        ':app': 'app',
+        ':lib:a': os.path.join('lib', 'a'),
+        ':x': os.path.join('libs', 'remapped'),
+        ':y': os.path.join('other', 'b'),
+        ':build2:core': os.path.join('build2', 'core'),
+    }
+
+
+@pytest.mark.parametrize('expression', [
+    'file("$rootDir/libs/x")',
+    "file('${rootDir}/libs/x')",
+    'file("$settingsDir/libs/x")',
+    'file("${rootProject.projectDir}/libs/x")',
+    'file("$rootDir.path/libs/x")',
+    'file(rootDir.path + "/libs/x")',
+    'File(rootDir, "libs/x")',
+    'file("$rootDir/other/../libs/x")',
+])
+def test_resolve_modules_root_dir_project_dir(tmp_path, expression):
+    make_dirs(tmp_path, 'libs/x')
+    (tmp_path / 'settings.gradle.kts').write_text(
+        f'include(":x")\nproject(":x").projectDir = {expression}\n', encoding='utf-8')
+
+    assert resolve_modules(str(tmp_path)) == {':x': os.path.join('libs', 'x')}
+
+
+def test_resolve_modules_root_dir_in_included_build(tmp_path):
+    make_dirs(tmp_path, 'build2/libs/x')
+    (tmp_path / 'settings.gradle').write_text("includeBuild 'build2'", encoding='utf-8')
+    (tmp_path / 'build2' / 'settings.gradle').write_text(
+        "include ':x'\nproject(':x').projectDir = file(\"$rootDir/libs/x\")", encoding='utf-8')
+
+    assert resolve_modules(str(tmp_path)) == {':build2:x': os.path.join('build2', 'libs', 'x')}
+
+
+def test_resolve_modules_cache_invalidated_on_change(tmp_path):
+    make_dirs(tmp_path, 'app', 'lib')
+    settings = tmp_path / 'settings.gradle'
+    settings.write_text("include ':app'\n", encoding='utf-8')
+    assert resolve_modules(str(tmp_path)) == {':app': 'app'}
+
+    settings.write_text("include ':app'\ninclude ':lib'\n", encoding='utf-8')
+    assert resolve_modules(str(tmp_path)) == {':app': 'app', ':lib': 'lib'}
+
+
+def test_assign_output_names_disambiguates_collisions():
+    core = 'core'
+    included_core = os.path.join('build2', 'core')
+    assert assign_output_names(['app', core, included_core]) == {
+        'app': 'app',
+        core: 'core',
+        included_core: 'build2_core',
+    }
@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+import metrics
+from app import app
+
+
+def samples():
+    """
+    解析render()的输出，返回指标行到数值的映射
+    """
+    result = {}
+    for line in metrics.render().splitlines():
+        if line and not line.startswith('#'):
+            series, value = line.rsplit(' ', 1)
+            result[series] = float(value)
+    return result
+
+
+def test_histogram_buckets_are_cumulative():
+    route = 'route="/histogram-test"'
+    for value in (0.07, 0.1, 0.3, 100):
+        metrics.observe('multilan_request_duration_seconds', value, route='/histogram-test')
+
+    values = samples()
+    buckets = {
+        bound: values[f'multilan_request_duration_seconds_bucket{{{route},le="{bound}"}}']
+        for bound in ('0.05', '0.1', '0.25', '0.5', '60', '120', '+Inf')
+    }
+    # 边界值计入le等于该值的桶
+    assert buckets == {'0.05': 0, '0.1': 2, '0.25': 2, '0.5': 3, '60': 3, '120': 4, '+Inf': 4}
+    assert values[f'multilan_request_duration_seconds_count{{{route}}}'] == 4
+    assert values[f'multilan_request_duration_seconds_sum{{{route}}}'] == pytest.approx(100.47)
+
+
+def test_label_values_are_escaped():
+    metrics.inc('multilan_requests_total', route='a"b\\c\nd', status='200')
+    assert 'multilan_requests_total{route="a\\"b\\\\c\\nd",status="200"} 1' in metrics.render().splitlines()
+
+
+def test_shards_of_exited_threads_are_merged():
+    def work():
+        for _ in range(10):
+            metrics.inc('multilan_cache_requests_total', cache='thread-test', result='hit')
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert samples()['multilan_cache_requests_total{cache="thread-test",result="hit"}'] == 80
+    # 已退出线程的分片在导出时被合并回收，不会继续累积
+    assert not any(thread in threads for thread, _ in metrics._shards)
+    assert samples()['multilan_cache_requests_total{cache="thread-test",result="hit"}'] == 80
+
+
+def test_metrics_endpoint_tracks_jobs(tmp_path):
+    client = app.test_client()
+    requests_series = 'multilan_requests_total{route="/export_excel",status="400"}'
+    count_series = 'multilan_request_duration_seconds_count{route="/export_excel"}'
+    before = samples()
+
+    response = client.post('/export_excel', data={
+        'project_path': str(tmp_path / 'missing'),
+        'output_dir': str(tmp_path / 'output'),
+    })
+    assert response.status_code == 400
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+    text = response.get_data(as_text=True)
+    assert '# TYPE multilan_request_duration_seconds histogram' in text
+
+    after = samples()
+    assert after[requests_series] == before.get(requests_series, 0) + 1
+    assert after[count_series] == before.get(count_series, 0) + 1
+    assert after['multilan_jobs_in_flight{route="/export_excel"}'] == 0
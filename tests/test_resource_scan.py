@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from flutter_packages import read_arb_locale
+from resource_scan import scan_arb_locale
+
+
+def write_arb(path, content):
+    path.write_text(content, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('data', [
+    {'@@locale': 'zh_CN', 'k1': 'v'},
+    {'k1': 'v {x} [y] "q" \\', '@k1': {'description': 'a" {', 'placeholders': {'x': {'a': [1, {'b': None}]}}},
+     'n': 1.5, 'b': True, '@@locale': 'en'},
+    {'ké': '中文', '@@locale': 'fr'},
+    {'k1': 'mentions @@locale in a value'},
+    {},
+])
+def test_scan_arb_locale_matches_json(tmp_path, data):
+    for indent in (None, 2):
+        path = write_arb(tmp_path / 'intl.arb', json.dumps(data, ensure_ascii=False, indent=indent))
+        # @@locale位于文件后半部分时扫描返回None，由read_arb_locale回退到完整解析
+        assert scan_arb_locale(path) in (data.get('@@locale', ''), None)
+        assert read_arb_locale(path) == data.get('@@locale', '')
+
+
+def test_scan_arb_locale_ignores_nested_locale(tmp_path):
+    path = write_arb(tmp_path / 'intl.arb', '{"@k": {"@@locale": "xx"}, "@@locale": "en"}')
+    assert scan_arb_locale(path) == 'en'
+
+
+def test_scan_arb_locale_falls_back_when_locale_is_late(tmp_path):
+    path = write_arb(tmp_path / 'intl.arb', json.dumps({'k1': 'v' * 100, '@@locale': 'en'}))
+    assert scan_arb_locale(path) is None
+    assert read_arb_locale(path) == 'en'
+
+
+def test_scan_arb_locale_stops_early(tmp_path):
+    # @@locale之后的内容不需要是合法JSON
+    path = write_arb(tmp_path / 'intl.arb', '{"@@locale": "en", "k": ')
+    assert scan_arb_locale(path) == 'en'
+
+
+def test_scan_arb_locale_unrecognized(tmp_path):
+    path = write_arb(tmp_path / 'intl.arb', '["@@locale"]')
+    assert scan_arb_locale(path) is None
+    assert read_arb_locale(path) == ''
+
+
+def test_scan_arb_locale_empty_file(tmp_path):
+    path = write_arb(tmp_path / 'intl.arb', '')
+    assert scan_arb_locale(path) == ''
+    assert read_arb_locale(path) == ''
@@ -0,0 +1,170 @@
+import random
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from export_excel import parse_xml_file
+from export_xml import generate_xml
+from string_codec import encode_string_value, parse_resource_xml, unescape_android_quotes, unescape_xml_text
+
+# 生成测试字符串使用的片段：普通文本、引号、XML特殊字符、反斜杠转义和CDATA
+TOKENS = [
+    'a', 'Z', '0', ' ', '中文', 'é', '%1$s', '@', '?',
+    "'", '"', '&', '<', '>', ';', '&amp;', '&lt;b&gt;',
+    '\\n', '\\t', '\\\\', '\\@', '\\u00e9',
+    '<![CDATA[<b>bold</b>]]>', "<![CDATA[it's & \\' \"]]>", '<![CDATA[]]>',
+]
+
+# 生成strings.xml源码中的字符串内容使用的片段，都是合法的Android写法
+SOURCE_TOKENS = [
+    'a', ' ', '  ', '中文', '%1$s', "\\'", '\\"', '&amp;', '&lt;', '&gt;', '\\n', '\\\\', '\\@',
+    '<![CDATA[<b>x</b>]]>',
+]
+
+
+def random_text(rng: random.Random) -> str:
+    text = ''.join(rng.choice(TOKENS) for _ in range(rng.randint(0, 12)))
+    if rng.random() < 0.2:
+        # 整体被双引号包裹的引用字符串
+        text = f'"{text}"'
+    return text
+
+
+def random_source(rng: random.Random) -> str:
+    body = ''.join(rng.choice(SOURCE_TOKENS) for _ in range(rng.randint(0, 10)))
+    roll = rng.random()
+    if roll < 0.2:
+        # 引用字符串中单引号不需要转义
+        return f'"{body}\'"'
+    if roll < 0.4:
+        return f'\\"{body}\\"'
+    return body
+
+
+def android_display(text: str) -> str:
+    """
+    按Android资源编译的规则计算字符串的显示内容：处理反斜杠转义，去掉引用字符串的双引号，合并引号外的空白
+    """
+    result = []
+    quoted = False
+    index = 0
+    while index < len(text):
+        if text.startswith('<![CDATA[', index):
+            end = text.index(']]>', index)
+            result.append(text[index + 9:end])
+            index = end + 3
+            continue
+        char = text[index]
+        if char == '\\' and index + 1 < len(text):
+            result.append({'n': '\n', 't': '\t'}.get(text[index + 1], text[index + 1]))
+            index += 2
+            continue
+        if char == '"':
+            quoted = not quoted
+        elif char.isspace() and not quoted:
+            if not result or result[-1] != ' ':
+                result.append(' ')
+        else:
+            result.append(char)
+        index += 1
+    return ''.join(result)
+
+
+def write_strings(path, content: str) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'<resources><string name="key">{content}</string></resources>', encoding='utf-8')
+    return str(path)
+
+
+def read_text(path) -> str:
+    return parse_resource_xml(str(path)).find('string').text or ''
+
+
+def round_trip(tmp_path, text: str) -> str:
+    return unescape_android_quotes(read_text(write_strings(tmp_path / 'strings.xml', encode_string_value(text))))
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_excel_value_round_trip_keeps_display(tmp_path, seed):
+    # 表格中的值写入XML后再导出，重新导入时显示内容不变，且再次往返结果不变
+    rng = random.Random(seed)
+    for _ in range(50):
+        text = random_text(rng)
+        exported = round_trip(tmp_path, text)
+        assert android_display(encode_string_value(exported)) == android_display(encode_string_value(text))
+        assert round_trip(tmp_path, exported) == exported
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_source_round_trip_keeps_display(tmp_path, seed):
+    # strings.xml导出到表格再原样导入，Android显示的内容不变
+    rng = random.Random(seed)
+    for index in range(50):
+        source = random_source(rng)
+        source_path = write_strings(tmp_path / f'source_{index}.xml', source)
+        output_path = tmp_path / f'output_{index}' / 'strings.xml'
+        (key, value, _), = parse_xml_file(source_path)
+        if not value.strip():
+            # 空值不会写回
+            continue
+        generate_xml({key: value}, str(output_path))
+        assert android_display(read_text(output_path)) == android_display(read_text(source_path)), source
+
+
+@pytest.mark.parametrize('source, exported', [
+    ('\\"OK\\"', '\\"OK\\"'),
+    ('"OK"', '"OK"'),
+    ("\\\"it\\'s\\\"", "\\\"it's\\\""),
+    ('"\\"OK\\""', '""OK""'),
+    ('\\"a\\\\\\"', '\\"a\\\\\\"'),
+])
+def test_outer_quotes_survive_export_and_import(tmp_path, source, exported):
+    source_path = write_strings(tmp_path / 'source.xml', source)
+    assert parse_xml_file(source_path) == [('key', exported, True)]
+
+    output_path = tmp_path / 'values' / 'strings.xml'
+    generate_xml({'key': exported}, str(output_path))
+    assert f'<string name="key">{source}</string>' in output_path.read_text(encoding='utf-8')
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("it's", "it\\'s"),
+    ('say "hi"', 'say \\"hi\\"'),
+    ('"it\'s quoted"', '"it\'s quoted"'),
+    ('a & b < c > d', 'a &amp; b &lt; c &gt; d'),
+    ('<![CDATA[<b>x</b>]]> & y', '<![CDATA[<b>x</b>]]> &amp; y'),
+    ("already \\'escaped\\'", "already \\'escaped\\'"),
+    ('\\n line', '\\n line'),
+])
+def test_encode_string_value(text, expected):
+    assert encode_string_value(text) == expected
+
+
+def test_encoded_value_is_well_formed():
+    text = ''.join(TOKENS)
+    ET.fromstring(f'<string>{encode_string_value(text)}</string>')
+
+
+def test_unescape_xml_text():
+    assert unescape_xml_text('&amp;lt; &#65;&#x42; &unknown; &quot;&apos;') == '&lt; AB &unknown; "\''
+    assert unescape_xml_text('<![CDATA[&amp;]]>') == '<![CDATA[&amp;]]>'
+
+
+def test_unescape_android_quotes_keeps_cdata():
+    assert unescape_android_quotes("\\'a\\' <![CDATA[\\'b\\']]> \\n") == "'a' <![CDATA[\\'b\\']]> \\n"
+
+
+def test_generate_xml_preserves_cdata(tmp_path):
+    xml_path = tmp_path / 'values' / 'strings.xml'
+    xml_path.parent.mkdir()
+    xml_path.write_text(
+        '<?xml version="1.0" encoding="utf-8"?>\n<resources>\n'
+        '    <string name="html"><![CDATA[<b>x</b>]]></string>\n'
+        '    <string name="amp">a &amp; b</string>\n'
+        '</resources>\n', encoding='utf-8')
+
+    generate_xml({'amp': "a & b's"}, str(xml_path))
+
+    content = xml_path.read_text(encoding='utf-8')
+    assert '<string name="html"><![CDATA[<b>x</b>]]></string>' in content
+    assert "<string name=\"amp\">a &amp; b\\'s</string>" in content